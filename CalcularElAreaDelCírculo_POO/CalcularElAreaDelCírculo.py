@@ -8,8 +8,27 @@
 
 # Importamos el módulo 'math' para acceder al valor de la constante pi.
 import math
+import sys
 PI_CONSTANTE = math.pi
 
+# numpy es opcional: si está instalado, los lotes de radios se calculan vectorizados.
+#  Se importa recién cuando se calcula un lote, para que el arranque sea rápido.
+np = None
+_numpy_cargado = False
+
+def _cargar_numpy():
+    global np, _numpy_cargado
+    if not _numpy_cargado:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        _numpy_cargado = True
+    return np
+
+# Cantidad aproximada de bytes que se leen por bloque en el modo de flujo.
+TAMANO_BLOQUE_LECTURA = 1 << 20
+
 # Funciones y variables: snake_case la función calcula el área de un círculo.
 def calcular_area_circulo(radio_circulo):
     # -aplicamos Identificador descriptivo siguiendo la convención snake_case: radio_circulo
@@ -18,6 +37,54 @@ def calcular_area_circulo(radio_circulo):
     area_calculada = PI_CONSTANTE * (radio_circulo ** 2)
     return area_calculada
 
+# Versión por lotes: recibe un arreglo de numpy o cualquier iterable de radios.
+def calcular_areas_circulos(radios_circulos):
+    # - Con numpy: el cálculo se hace sobre todo el arreglo a la vez (vectorizado).
+    # - Sin numpy: se devuelve una lista con el área de cada radio.
+    np = _cargar_numpy()
+    if np is not None:
+        # Siempre en float: con un arreglo de enteros, radio ** 2 desbordaría int64 sin avisar.
+        if hasattr(radios_circulos, "__len__"):
+            radios_circulos = np.asarray(radios_circulos, dtype=float)
+        else:
+            radios_circulos = np.fromiter(radios_circulos, dtype=float)  # Generadores y otros iteradores.
+        return PI_CONSTANTE * (radios_circulos ** 2)
+    return [PI_CONSTANTE * (radio ** 2) for radio in radios_circulos]
+
+# Modo de flujo: lee radios (uno por línea) desde 'entrada' por bloques grandes
+#  y escribe "radio,area" en 'salida' con una sola escritura por bloque.
+#  Las líneas inválidas se informan en 'errores' (por defecto sys.stderr) y se devuelve cuántas hubo.
+def procesar_flujo_radios(entrada, salida, errores=None, tamano_bloque=TAMANO_BLOQUE_LECTURA):
+    # sys.stderr se busca al llamar, así se respeta si fue redirigido después de importar.
+    if errores is None:
+        errores = sys.stderr
+    numero_linea = 0
+    lineas_invalidas = 0
+    while True:
+        # - Tipo de dato: 'bloque_lineas' es una lista de strings.
+        bloque_lineas = entrada.readlines(tamano_bloque)
+        if not bloque_lineas:
+            break
+        radios_validos = []
+        for linea in bloque_lineas:
+            numero_linea += 1
+            texto = linea.strip()
+            if not texto:
+                continue
+            try:
+                radio_leido = float(texto)
+            except ValueError:
+                radio_leido = None
+            # Misma regla que el modo interactivo: el radio debe ser positivo.
+            if radio_leido is not None and radio_leido > 0:
+                radios_validos.append(radio_leido)
+            else:
+                lineas_invalidas += 1
+                errores.write(f"Línea {numero_linea}: el radio debe ser un número positivo ({texto!r}).\n")
+        areas = calcular_areas_circulos(radios_validos)
+        salida.write("".join(f"{radio},{area:.4f}\n" for radio, area in zip(radios_validos, areas)))
+    return lineas_invalidas
+
 # Función principal para la lógica del programa.
 def main():
     # - Identificador descriptivo siguiendo la convención snake_case: 'mensaje_bienvenida'
@@ -67,6 +134,66 @@ def main():
             # aplicamos el tipo de dato string.
             print("Entrada no válida. Por favor, ingresa un número o 'salir'.")
 
+# Modo trabajador: atiende pedidos (un radio por línea) que llegan por una tubería
+#  y responde una línea por pedido, vaciando la salida para no bloquear al cliente.
+def atender_pedidos(entrada, salida):
+    for linea in entrada:
+        texto = linea.strip()
+        if not texto:
+            continue
+        try:
+            radio_pedido = float(texto)
+        except ValueError:
+            radio_pedido = None
+        if radio_pedido is not None and radio_pedido > 0:
+            salida.write(f"{radio_pedido},{calcular_area_circulo(radio_pedido):.4f}\n")
+        else:
+            salida.write(f"error,el radio debe ser un número positivo ({texto!r})\n")
+        salida.flush()
+
+# Interfaz de línea de comandos (sin argumentos se usa el modo interactivo):
+#   area --radius 2 3.5     calcula las áreas indicadas
+#   area --file radios.txt  procesa un archivo por bloques ('-' = entrada estándar)
+#   worker                  atiende pedidos línea por línea por la entrada estándar
+# Los argumentos se leen a mano: importar argparse duplica el tiempo de arranque.
+USO_CLI = ("uso: CalcularElAreaDelCírculo.py area --radius RADIO [RADIO ...]\n"
+           "     CalcularElAreaDelCírculo.py area --file ARCHIVO\n"
+           "     CalcularElAreaDelCírculo.py worker\n")
+
+def main_cli(argumentos):
+    if argumentos[0] in ("-h", "--help"):
+        sys.stdout.write(USO_CLI)
+        return 0
+    if argumentos == ["worker"]:
+        atender_pedidos(sys.stdin, sys.stdout)
+        return 0
+    if len(argumentos) >= 3 and argumentos[:2] == ["area", "--radius"]:
+        try:
+            radios_pedidos = [float(texto) for texto in argumentos[2:]]
+        except ValueError:
+            sys.stderr.write("Entrada no válida: el radio debe ser un número.\n")
+            return 1
+        if any(not radio > 0 for radio in radios_pedidos):
+            sys.stderr.write("El radio debe ser un número positivo.\n")
+            return 1
+        sys.stdout.write("".join(f"{calcular_area_circulo(radio):.4f}\n" for radio in radios_pedidos))
+        return 0
+    if len(argumentos) == 3 and argumentos[:2] == ["area", "--file"]:
+        if argumentos[2] == "-":
+            cantidad_errores = procesar_flujo_radios(sys.stdin, sys.stdout)
+        else:
+            try:
+                with open(argumentos[2], encoding="utf-8") as archivo_radios:
+                    cantidad_errores = procesar_flujo_radios(archivo_radios, sys.stdout)
+            except OSError as error:
+                sys.stderr.write(f"No se pudo leer {argumentos[2]}: {error.strerror or error}\n")
+                return 1
+        return 1 if cantidad_errores else 0
+    sys.stderr.write(USO_CLI)
+    return 2
+
 # Por ultimo realizamos la ejecion del programa
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        sys.exit(main_cli(sys.argv[1:]))
+    main()
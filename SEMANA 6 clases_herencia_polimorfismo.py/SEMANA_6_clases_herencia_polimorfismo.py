@@ -5,6 +5,9 @@
 # Demostrar cómo diferentes tipos de usuarios (estudiantes, profesores) pueden mostrar
 # su información de manera única, aunque se les pida hacerlo con el mismo comando.
 
+from bisect import bisect_left, insort
+from itertools import count
+
 # --- Clases: Planos para objetos ---
 
 class Persona:
@@ -63,6 +66,7 @@ class Estudiante(Persona):
         self._materias_matriculadas = [] # Materias inscritas (encapsulación).
         self._calificaciones_por_materia = {} # Calificaciones (encapsulación).
         self._promedio_general = 0.0 # Calculado internamente (encapsulación).
+        self._rankings = [] # Rankings a los que pertenece; se avisa a todos al cambiar el promedio.
 
     # Obtiene carrera.
     def obtener_carrera(self):
@@ -118,10 +122,14 @@ class Estudiante(Persona):
                 total_puntos += promedio_materia * creditos
                 total_creditos += creditos
 
+        promedio_anterior = self._promedio_general
         if total_creditos > 0:
             self._promedio_general = total_puntos / total_creditos
         else:
             self._promedio_general = 0.0
+        if self._rankings and self._promedio_general != promedio_anterior:
+            for ranking in self._rankings:
+                ranking.actualizar(self)
 
 
 class Profesor(Persona):
@@ -154,6 +162,174 @@ class Profesor(Persona):
                 f"Materias a cargo: [{materias_str}]")
 
 
+class RankingEstudiantes:
+    # Ranking por promedio general (mayor promedio = posición 0).
+    # Lista ordenada dividida en bloques, con un árbol de Fenwick sobre el tamaño
+    # de cada bloque: ubicar, insertar y quitar un estudiante cuesta O(log n).
+    CARGA = 1000 # Tamaño de referencia de cada bloque.
+
+    def __init__(self):
+        self._bloques = [] # Bloques ordenados de claves (-promedio, número).
+        self._maximos = [] # Última clave de cada bloque (para bisect).
+        self._fenwick = [] # Árbol de Fenwick con los tamaños de los bloques.
+        self._clave_por_estudiante = {}
+        self._estudiante_por_numero = {}
+        self._numeros = count()
+
+    def __len__(self):
+        return len(self._clave_por_estudiante)
+
+    # Agrega un estudiante; desde ahora el ranking se actualiza solo.
+    def agregar(self, estudiante):
+        if estudiante in self._clave_por_estudiante:
+            return
+        numero = next(self._numeros)
+        clave = (-estudiante.obtener_promedio_general(), numero)
+        self._estudiante_por_numero[numero] = estudiante
+        self._clave_por_estudiante[estudiante] = clave
+        estudiante._rankings.append(self)
+        self._insertar(clave)
+
+    # Carga masiva: ordena una sola vez en lugar de insertar uno por uno.
+    def agregar_varios(self, estudiantes):
+        nuevos = [e for e in dict.fromkeys(estudiantes) if e not in self._clave_por_estudiante]
+        if len(self) > 0:
+            for estudiante in nuevos:
+                self.agregar(estudiante)
+            return
+        claves = []
+        for estudiante in nuevos:
+            numero = next(self._numeros)
+            clave = (-estudiante.obtener_promedio_general(), numero)
+            self._estudiante_por_numero[numero] = estudiante
+            self._clave_por_estudiante[estudiante] = clave
+            estudiante._rankings.append(self)
+            claves.append(clave)
+        claves.sort()
+        self._bloques = [claves[i:i + self.CARGA] for i in range(0, len(claves), self.CARGA)]
+        self._maximos = [bloque[-1] for bloque in self._bloques]
+        self._reconstruir_fenwick()
+
+    # Quita un estudiante del ranking.
+    def quitar(self, estudiante):
+        clave = self._clave_por_estudiante.pop(estudiante)
+        del self._estudiante_por_numero[clave[1]]
+        estudiante._rankings.remove(self) # Solo se desvincula este ranking.
+        self._eliminar(clave)
+
+    # Reubica al estudiante (lo llama Estudiante al cambiar su promedio).
+    def actualizar(self, estudiante):
+        clave = self._clave_por_estudiante[estudiante]
+        nueva_clave = (-estudiante.obtener_promedio_general(), clave[1])
+        if nueva_clave != clave:
+            self._eliminar(clave)
+            self._insertar(nueva_clave)
+            self._clave_por_estudiante[estudiante] = nueva_clave
+
+    # Posición del estudiante (0 = mejor promedio).
+    def posicion(self, estudiante):
+        clave = self._clave_por_estudiante[estudiante]
+        i = bisect_left(self._maximos, clave)
+        return self._suma_hasta(i) + bisect_left(self._bloques[i], clave)
+
+    # Estudiante que ocupa una posición (0 = mejor promedio).
+    def estudiante_en(self, posicion):
+        if not 0 <= posicion < len(self):
+            raise IndexError("Posición fuera del ranking.")
+        i, resto = self._buscar_bloque(posicion)
+        return self._estudiante_por_numero[self._bloques[i][resto][1]]
+
+    # Los k mejores estudiantes, de mayor a menor promedio.
+    def mejores(self, k):
+        if k <= 0:
+            return []
+        resultado = []
+        for bloque in self._bloques:
+            for clave in bloque[:k - len(resultado)]:
+                resultado.append(self._estudiante_por_numero[clave[1]])
+            if len(resultado) >= k:
+                break
+        return resultado
+
+    # Percentil del estudiante: porcentaje del grupo que queda por debajo de él.
+    def percentil(self, estudiante):
+        total = len(self)
+        return 100.0 * (total - 1 - self.posicion(estudiante)) / total
+
+    # Estudiante ubicado en un percentil dado (100 = el mejor).
+    def estudiante_en_percentil(self, percentil):
+        total = len(self)
+        posicion = total - 1 - int(percentil / 100.0 * (total - 1))
+        return self.estudiante_en(min(max(posicion, 0), total - 1))
+
+    # Métodos internos: lista por bloques y árbol de Fenwick (encapsulación).
+    def _insertar(self, clave):
+        if not self._bloques:
+            self._bloques.append([clave])
+            self._maximos.append(clave)
+            self._reconstruir_fenwick()
+            return
+        i = bisect_left(self._maximos, clave)
+        if i == len(self._bloques):
+            i -= 1
+        bloque = self._bloques[i]
+        insort(bloque, clave)
+        self._maximos[i] = bloque[-1]
+        if len(bloque) > 2 * self.CARGA:
+            self._bloques[i:i + 1] = [bloque[:self.CARGA], bloque[self.CARGA:]]
+            self._maximos[i:i + 1] = [bloque[self.CARGA - 1], bloque[-1]]
+            self._reconstruir_fenwick()
+        else:
+            self._sumar_fenwick(i, 1)
+
+    def _eliminar(self, clave):
+        i = bisect_left(self._maximos, clave)
+        bloque = self._bloques[i]
+        del bloque[bisect_left(bloque, clave)]
+        if bloque:
+            self._maximos[i] = bloque[-1]
+            self._sumar_fenwick(i, -1)
+        else:
+            del self._bloques[i]
+            del self._maximos[i]
+            self._reconstruir_fenwick()
+
+    def _reconstruir_fenwick(self):
+        arbol = [0] + [len(bloque) for bloque in self._bloques]
+        for i in range(1, len(arbol)):
+            padre = i + (i & -i)
+            if padre < len(arbol):
+                arbol[padre] += arbol[i]
+        self._fenwick = arbol
+
+    def _sumar_fenwick(self, indice, cantidad):
+        i = indice + 1
+        while i < len(self._fenwick):
+            self._fenwick[i] += cantidad
+            i += i & -i
+
+    def _suma_hasta(self, indice):
+        # Cantidad de claves en los bloques anteriores a 'indice'.
+        total = 0
+        i = indice
+        while i > 0:
+            total += self._fenwick[i]
+            i -= i & -i
+        return total
+
+    def _buscar_bloque(self, posicion):
+        # Desciende por el árbol de Fenwick hasta el bloque que contiene 'posicion'.
+        indice = 0
+        paso = 1 << (len(self._fenwick).bit_length())
+        while paso:
+            siguiente = indice + paso
+            if siguiente < len(self._fenwick) and self._fenwick[siguiente] <= posicion:
+                indice = siguiente
+                posicion -= self._fenwick[siguiente]
+            paso >>= 1
+        return indice, posicion
+
+
 # --- Bloque Principal: Demostración ---
 
 if __name__ == "__main__":
@@ -209,4 +385,15 @@ if __name__ == "__main__":
                 print(f"  Docente asignado: {elemento._docente_asignado.obtener_nombre_completo()}")
         print("=" * 60)
 
+    # Ranking: se actualiza solo cuando cambia el promedio de un estudiante.
+    print("\n--- Ranking por Promedio ---")
+    ana_torres = Estudiante("Ana", "Torres", "1720000003", "Ingeniería en TICS")
+    ranking = RankingEstudiantes()
+    ranking.agregar_varios([elvio_lapo, ana_torres])
+    ana_torres.matricular_materia(poo)
+    ana_torres.registrar_calificacion("POO101", 95)
+    for posicion, estudiante in enumerate(ranking.mejores(2), start=1):
+        print(f"{posicion}. {estudiante.obtener_nombre_completo()}: {estudiante.obtener_promedio_general():.2f}")
+    print(f"Percentil de {elvio_lapo.obtener_nombre_completo()}: {ranking.percentil(elvio_lapo):.0f}")
+
     print("\n--- FIN de la DEMO ---")
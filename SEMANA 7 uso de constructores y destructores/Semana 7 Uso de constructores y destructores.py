@@ -6,11 +6,17 @@
 
 import time  # Importa el módulo 'time' para usar time.sleep() y simular pausas en las lecturas del sensor.
 import random  # Importa el módulo 'random' para generar valores aleatorios para la simulación de las lecturas.
+import heapq  # Importa el módulo 'heapq' para mantener la cola de lecturas pendientes del planificador.
+import itertools  # Importa 'itertools' para numerar las entradas del montículo (desempate estable).
 
 # Define la clase Sensor. Representa un dispositivo de sensor de datos.
 # Esta clase demuestra los conceptos de constructores y destructores en Python.
 class Sensor:
 
+    # Retardo (en segundos) que simula el tiempo de lectura del hardware.
+    # Se puede poner en 0 para medir solo el costo del método (por ejemplo, en benchmarks).
+    RETARDO_LECTURA = 0.05
+
     # Define el método constructor. Se ejecuta automáticamente al crear un nuevo objeto Sensor.
     # Su objetivo es inicializar todos los atributos del sensor y asegurar un estado válido.
     def __init__(self, id_sensor, tipo, unidad, valor_inicial=0.0):
@@ -60,7 +66,8 @@ class Sensor:
     def leer_valor(self):
         # Solo permite leer si el sensor está marcado como activo.
         if self.activo:
-            time.sleep(0.05)  # Simula un pequeño retardo en la lectura.
+            if self.RETARDO_LECTURA:
+                time.sleep(self.RETARDO_LECTURA)  # Simula un pequeño retardo en la lectura.
             # Genera una pequeña variación aleatoria para simular fluctuaciones en la lectura.
             self.valor_actual = round(self.valor_actual + (random.random() - 0.5) * 0.5, 2)
             # Imprime el valor leído por el sensor.
@@ -125,6 +132,106 @@ class Sensor:
             print("[DESTRUCTOR] Objeto Sensor incompleto destruido (sin ID conocido).")
 
 
+# Intervalos de lectura por defecto (en segundos) según el tipo de sensor.
+# Temperatura a 1 Hz, Luz a 10 Hz y Humedad a 0.1 Hz.
+INTERVALOS_POR_TIPO = {"Temperatura": 1.0, "Luz": 0.1, "Humedad": 10.0}
+
+
+# Define la clase PlanificadorSensores. Lee cada sensor a su propia frecuencia.
+# Guarda la próxima lectura de cada sensor en un montículo (min-heap), así en cada
+# ciclo solo se atienden los sensores que ya vencieron y no se recorre toda la flota.
+class PlanificadorSensores:
+
+    # Constructor: el reloj y la función de espera se pueden reemplazar (útil para simulaciones).
+    def __init__(self, reloj=time.monotonic, dormir=time.sleep):
+        self.reloj = reloj
+        self.dormir = dormir
+        self._pendientes = []  # Montículo de (instante_programado, número, sensor, intervalo).
+        self._contador = itertools.count()  # Desempata sensores programados en el mismo instante.
+        self._entrada_vigente = {}  # sensor -> número de su única entrada válida en el montículo.
+        self.lecturas_realizadas = 0
+        self.retraso_total = 0.0  # Suma de los retrasos (instante real - instante programado).
+        self.retraso_maximo = 0.0
+
+    def __len__(self):
+        return len(self._entrada_vigente)
+
+    # Agrega un sensor con su intervalo de lectura (si no se indica, se usa el de su tipo).
+    # Si el sensor ya estaba programado, su entrada anterior se reemplaza (no se lee dos veces).
+    def agregar(self, sensor, intervalo=None):
+        if intervalo is None:
+            intervalo = INTERVALOS_POR_TIPO.get(sensor.tipo, 1.0)
+        if intervalo <= 0:
+            raise ValueError("Error: El intervalo de lectura debe ser positivo.")
+        if sensor.activo:
+            self._programar(self.reloj(), sensor, intervalo)
+
+    def _programar(self, instante, sensor, intervalo):
+        numero = next(self._contador)
+        self._entrada_vigente[sensor] = numero
+        heapq.heappush(self._pendientes, (instante, numero, sensor, intervalo))
+
+    # Quita del tope del montículo las entradas reemplazadas y las de sensores desactivados.
+    def _descartar_obsoletas(self):
+        pendientes = self._pendientes
+        while pendientes:
+            _, numero, sensor, _ = pendientes[0]
+            if self._entrada_vigente.get(sensor) == numero and sensor.activo:
+                return
+            heapq.heappop(pendientes)
+            if self._entrada_vigente.get(sensor) == numero:
+                del self._entrada_vigente[sensor]
+
+    # Devuelve cuántos segundos faltan para la próxima lectura (None si no hay sensores).
+    def tiempo_hasta_proxima(self):
+        self._descartar_obsoletas()
+        if not self._pendientes:
+            return None
+        return max(0.0, self._pendientes[0][0] - self.reloj())
+
+    # Lee solo los sensores vencidos y los vuelve a programar. Devuelve una lista de (sensor, valor).
+    # Los sensores desactivados (desactivar) se descartan al salir del montículo.
+    def ejecutar_pendientes(self):
+        lecturas = []
+        # Solo se atienden las lecturas vencidas al entrar, para no encadenar una ronda con la siguiente.
+        limite = self.reloj()
+        self._descartar_obsoletas()
+        while self._pendientes and self._pendientes[0][0] <= limite:
+            programado, _, sensor, intervalo = heapq.heappop(self._pendientes)
+            # Cada lectura bloquea (RETARDO_LECTURA): el retraso se mide con el reloj justo antes de leer.
+            ahora = self.reloj()
+            retraso = ahora - programado
+            self.retraso_total += retraso
+            self.retraso_maximo = max(self.retraso_maximo, retraso)
+            self.lecturas_realizadas += 1
+            lecturas.append((sensor, sensor.leer_valor()))
+            # Se mantiene la cadencia original; si el atraso supera un intervalo, se reprograma desde ahora.
+            siguiente = programado + intervalo
+            if siguiente <= ahora:
+                siguiente = ahora + intervalo
+            self._programar(siguiente, sensor, intervalo)
+            self._descartar_obsoletas()
+        return lecturas
+
+    # Ejecuta el planificador durante 'duracion' segundos, durmiendo hasta cada lectura vencida.
+    def ejecutar(self, duracion):
+        fin = self.reloj() + duracion
+        while self.reloj() < fin:
+            proxima = self.tiempo_hasta_proxima()
+            if proxima is None:  # No quedan sensores activos.
+                break
+            espera = min(proxima, fin - self.reloj())
+            if espera > 0:
+                self.dormir(espera)
+            self.ejecutar_pendientes()
+
+    # Devuelve un resumen del retraso de planificación (en segundos).
+    def reporte_retraso(self):
+        promedio = self.retraso_total / self.lecturas_realizadas if self.lecturas_realizadas else 0.0
+        return {"lecturas": self.lecturas_realizadas, "retraso_promedio": promedio,
+                "retraso_maximo": self.retraso_maximo}
+
+
 # --- Bloque Principal de Demostración ---
 # Este código se ejecuta solo cuando el script se corre directamente (no cuando es importado).
 if __name__ == "__main__":
@@ -189,6 +296,16 @@ if __name__ == "__main__":
     except ValueError as e:
         print(f"ERROR: Fallo al crear sensor de luz: {e}")
 
+    # DEMO 5: Planificador con una frecuencia de lectura distinta para cada sensor.
+    # Durante 2 segundos la luz (10 Hz) se lee muchas más veces que la temperatura (1 Hz).
+    print("\n\n[DEMO 5] Planificador de lecturas por frecuencia:")
+    planificador = PlanificadorSensores()
+    planificador.agregar(Sensor("T_010", "Temperatura", "°C", 21.0))
+    planificador.agregar(Sensor("L_011", "Luz", "Lux", 300.0))
+    planificador.agregar(Sensor("H_012", "Humedad", "% HR", 55.0))
+    planificador.ejecutar(2.0)
+    print(f"--> Resumen del planificador: {planificador.reporte_retraso()}")
+
     print("\n------------------------------------")
     print("--- FIN DEMOSTRACIÓN ---")
 
@@ -1,3 +1,6 @@
+import time
+
+
 class Personaje:
 
     def __init__(self, nombre, fuerza, inteligencia, defensa, vida):
@@ -22,21 +25,24 @@ class Personaje:
     def esta_vivo(self):
         return self.vida > 0
 
-    def morir(self):
+    def morir(self, silencioso=False):
         self.vida = 0
-        print(self.nombre, "ha muerto")
+        if not silencioso:
+            print(self.nombre, "ha muerto")
 
     def daño(self, enemigo):
         return self.fuerza - enemigo.defensa
 
-    def atacar(self, enemigo):
+    def atacar(self, enemigo, silencioso=False):
         daño = self.daño(enemigo)
         enemigo.vida = enemigo.vida - daño
-        print(self.nombre, "ha realizado", daño, "puntos de daño a", enemigo.nombre)
+        if not silencioso:
+            print(self.nombre, "ha realizado", daño, "puntos de daño a", enemigo.nombre)
         if enemigo.esta_vivo():
-            print("Vida de", enemigo.nombre, "es", enemigo.vida)
+            if not silencioso:
+                print("Vida de", enemigo.nombre, "es", enemigo.vida)
         else:
-            enemigo.morir()
+            enemigo.morir(silencioso)
 
 
 class Guerrero(Personaje):
@@ -93,10 +99,170 @@ def combate(jugador_1, jugador_2):
         print("\nEmpate")
 
 
-personaje_1 = Guerrero("Guts", 20, 10, 4, 100, 4)
-personaje_2 = Mago("Vanessa", 5, 15, 4, 100, 3)
+class MonticuloIndexado:
+
+    def __init__(self):
+        self.elementos = []
+        self.posiciones = {}
+        self.orden = 0
+
+    def __len__(self):
+        return len(self.elementos)
+
+    def __contains__(self, personaje):
+        return personaje in self.posiciones
+
+    def primero(self):
+        return self.elementos[0][2] if self.elementos else None
+
+    def agregar(self, personaje):
+        self.orden = self.orden + 1
+        self.elementos.append([personaje.vida, self.orden, personaje])
+        self.posiciones[personaje] = len(self.elementos) - 1
+        self.subir(len(self.elementos) - 1)
+
+    def actualizar(self, personaje):
+        i = self.posiciones[personaje]
+        self.elementos[i][0] = personaje.vida
+        self.subir(i)
+        self.bajar(self.posiciones[personaje])
+
+    def quitar(self, personaje):
+        i = self.posiciones.pop(personaje)
+        ultimo = self.elementos.pop()
+        if i < len(self.elementos):
+            self.elementos[i] = ultimo
+            self.posiciones[ultimo[2]] = i
+            self.subir(i)
+            self.bajar(self.posiciones[ultimo[2]])
+
+    def intercambiar(self, i, j):
+        self.elementos[i], self.elementos[j] = self.elementos[j], self.elementos[i]
+        self.posiciones[self.elementos[i][2]] = i
+        self.posiciones[self.elementos[j][2]] = j
+
+    def subir(self, i):
+        while i > 0:
+            padre = (i - 1) // 2
+            if self.elementos[i][:2] >= self.elementos[padre][:2]:
+                break
+            self.intercambiar(i, padre)
+            i = padre
+
+    def bajar(self, i):
+        total = len(self.elementos)
+        while True:
+            menor = i
+            for hijo in (2 * i + 1, 2 * i + 2):
+                if hijo < total and self.elementos[hijo][:2] < self.elementos[menor][:2]:
+                    menor = hijo
+            if menor == i:
+                break
+            self.intercambiar(i, menor)
+            i = menor
+
+
+class Arena:
+
+    def __init__(self, equipos, silencioso=False):
+        self.silencioso = silencioso
+        self.equipo_de = {}
+        self.vivos = []
+        # Montículo con el más débil de cada equipo: elegir objetivo cuesta O(1)
+        # y mantenerlo O(log equipos), aunque haya un combatiente por equipo.
+        self.lideres = MonticuloIndexado()
+        self.lider = []
+        for numero, equipo in enumerate(equipos):
+            monticulo = MonticuloIndexado()
+            for personaje in equipo:
+                if personaje.esta_vivo():
+                    self.equipo_de[personaje] = numero
+                    monticulo.agregar(personaje)
+            self.vivos.append(monticulo)
+            self.lider.append(None)
+            self.refrescar_lider(numero)
+        self.metricas = []
+
+    def equipos_en_pie(self):
+        return [numero for numero, monticulo in enumerate(self.vivos) if len(monticulo) > 0]
+
+    def refrescar_lider(self, numero):
+        nuevo = self.vivos[numero].primero()
+        viejo = self.lider[numero]
+        if nuevo is viejo:
+            if nuevo is not None:
+                self.lideres.actualizar(nuevo)
+            return
+        if viejo is not None:
+            self.lideres.quitar(viejo)
+        if nuevo is not None:
+            self.lideres.agregar(nuevo)
+        self.lider[numero] = nuevo
+
+    def objetivo(self, personaje):
+        propio = self.equipo_de[personaje]
+        elementos = self.lideres.elementos
+        if not elementos:
+            return None
+        if self.equipo_de[elementos[0][2]] != propio:
+            return elementos[0][2]
+        # La raíz es del propio equipo: como cada equipo tiene un solo líder,
+        # el rival más débil es el menor de sus dos hijos.
+        hijos = elementos[1:3]
+        return min(hijos)[2] if hijos else None
+
+    def ronda(self):
+        inicio = time.perf_counter()
+        ataques = 0
+        bajas = 0
+        for atacante in [p for monticulo in self.vivos for p in monticulo.posiciones]:
+            if atacante not in self.vivos[self.equipo_de[atacante]]:
+                continue
+            enemigo = self.objetivo(atacante)
+            if enemigo is None:
+                break
+            if not self.silencioso:
+                print(">>> Acción de ", atacante.nombre, ":", sep="")
+            atacante.atacar(enemigo, self.silencioso)
+            ataques = ataques + 1
+            equipo_enemigo = self.equipo_de[enemigo]
+            if enemigo.esta_vivo():
+                self.vivos[equipo_enemigo].actualizar(enemigo)
+            else:
+                self.vivos[equipo_enemigo].quitar(enemigo)
+                bajas = bajas + 1
+            self.refrescar_lider(equipo_enemigo)
+        duracion = time.perf_counter() - inicio
+        self.metricas.append({
+            "ataques": ataques,
+            "bajas": bajas,
+            "segundos": duracion,
+            "ataques_por_segundo": ataques / duracion if duracion > 0 else 0.0,
+        })
+        return ataques
+
+    def combatir(self, max_rondas=1000):
+        turno = 0
+        while len(self.equipos_en_pie()) > 1 and turno < max_rondas:
+            if not self.silencioso:
+                print("\nTurno", turno)
+            self.ronda()
+            turno = turno + 1
+        en_pie = self.equipos_en_pie()
+        ganador = en_pie[0] if len(en_pie) == 1 else None
+        if not self.silencioso:
+            if ganador is None:
+                print("\nEmpate")
+            else:
+                print("\nHa ganado el equipo", ganador)
+        return ganador
+
+
+if __name__ == "__main__":
+    personaje_1 = Guerrero("Guts", 20, 10, 4, 100, 4)
+    personaje_2 = Mago("Vanessa", 5, 15, 4, 100, 3)
 
-personaje_1.atributos()
-personaje_2.atributos()
+    personaje_1.atributos()
+    personaje_2.atributos()
 
-combate(personaje_1, personaje_2)
\ No newline at end of file
+    combate(personaje_1, personaje_2)
@@ -21,14 +21,6 @@ def calculate_interest():
     interest = balance * interest_rate
     balance += interest
 
-# Uso de las funciones en la programación tradicional
-deposit(1000)
-withdraw(500)
-calculate_interest()
-
-# Imprimir el saldo final
-print("Balance (Traditional):", balance)
-
 
 # Programación Orientada a Objetos (POO)
 # Ejemplo: Gestión de una cuenta bancaria
@@ -48,13 +40,23 @@ class BankAccount:
         interest = self.balance * self.interest_rate
         self.balance += interest
 
-# Crear una instancia de la clase BankAccount
-account = BankAccount()
 
-# Uso de los métodos en la programación orientada a objetos
-account.deposit(1000)
-account.withdraw(500)
-account.calculate_interest()
+if __name__ == "__main__":
+    # Uso de las funciones en la programación tradicional
+    deposit(1000)
+    withdraw(500)
+    calculate_interest()
+
+    # Imprimir el saldo final
+    print("Balance (Traditional):", balance)
+
+    # Crear una instancia de la clase BankAccount
+    account = BankAccount()
+
+    # Uso de los métodos en la programación orientada a objetos
+    account.deposit(1000)
+    account.withdraw(500)
+    account.calculate_interest()
 
-# Imprimir el saldo final
-print("Balance (OOP):", account.balance)
\ No newline at end of file
+    # Imprimir el saldo final
+    print("Balance (OOP):", account.balance)
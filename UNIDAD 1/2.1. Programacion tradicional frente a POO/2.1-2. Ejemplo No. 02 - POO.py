@@ -1,6 +1,9 @@
 # Programación Orientada a Objetos (POO)
 # Ejemplo: Gestión de un vehículo
 
+# numpy solo es necesario para la flota (Fleet); se importa al crear la primera.
+np = None
+
 class Vehicle:
     def __init__(self, fuel_efficiency=25):
         self.fuel_tank = 0
@@ -19,13 +22,72 @@ class Vehicle:
         else:
             print("Not enough fuel to drive that far.")
 
-# Crear una instancia de la clase Vehicle
-car = Vehicle()
+# Flota de vehículos: los mismos datos de Vehicle, pero guardados en arreglos
+# (una posición por vehículo) para simular millones de viajes por ciclo.
+class Fleet:
+    def __init__(self, size, fuel_efficiency=25):
+        global np
+        if np is None:
+            try:
+                import numpy as np
+            except ImportError:
+                raise ImportError("Fleet necesita numpy (pip install numpy).") from None
+        self.fuel_tank = np.zeros(size)
+        self.mileage = np.zeros(size)
+        self.fuel_efficiency = np.full(size, fuel_efficiency, dtype=float)
+
+    @classmethod
+    def from_vehicles(cls, vehicles):
+        """Crea una flota copiando el estado de objetos Vehicle."""
+        fleet = cls(len(vehicles))
+        fleet.fuel_tank[:] = [v.fuel_tank for v in vehicles]
+        fleet.mileage[:] = [v.mileage for v in vehicles]
+        fleet.fuel_efficiency[:] = [v.fuel_efficiency for v in vehicles]
+        return fleet
+
+    def __len__(self):
+        return len(self.fuel_tank)
+
+    def fill_tank(self, amounts, vehicle_ids=None):
+        """Llena el tanque de todos los vehículos (o solo de vehicle_ids)."""
+        if vehicle_ids is None:
+            self.fuel_tank += amounts
+        else:
+            np.add.at(self.fuel_tank, vehicle_ids, amounts)
+
+    def drive(self, distances, vehicle_ids=None):
+        """Aplica un lote de viajes con la misma regla que Vehicle.drive.
+
+        Sin vehicle_ids, distances trae un viaje por vehículo (0 = no viaja).
+        Con vehicle_ids, cada vehículo puede aparecer una sola vez por lote.
+        Devuelve la máscara de viajes rechazados por falta de combustible.
+        """
+        distances = np.asarray(distances, dtype=float)
+        if vehicle_ids is None:
+            fuel_needed = distances / self.fuel_efficiency
+            accepted = fuel_needed <= self.fuel_tank
+            self.fuel_tank -= np.where(accepted, fuel_needed, 0.0)
+            self.mileage += np.where(accepted, distances, 0.0)
+            return ~accepted
+
+        vehicle_ids = np.asarray(vehicle_ids)
+        if len(np.unique(vehicle_ids)) != len(vehicle_ids):
+            raise ValueError("Un vehículo no puede tener dos viajes en el mismo lote.")
+        fuel_needed = distances / self.fuel_efficiency[vehicle_ids]
+        accepted = fuel_needed <= self.fuel_tank[vehicle_ids]
+        moved = vehicle_ids[accepted]
+        self.fuel_tank[moved] -= fuel_needed[accepted]
+        self.mileage[moved] += distances[accepted]
+        return ~accepted
+
+if __name__ == "__main__":
+    # Crear una instancia de la clase Vehicle
+    car = Vehicle()
 
-# Uso de los métodos en la programación orientada a objetos
-car.fill_tank(20)
-car.drive(100)
+    # Uso de los métodos en la programación orientada a objetos
+    car.fill_tank(20)
+    car.drive(100)
 
-# Imprimir la distancia recorrida y el nivel de combustible restante
-print("Mileage (OOP):", car.mileage)
-print("Fuel Tank (OOP):", car.fuel_tank)
\ No newline at end of file
+    # Imprimir la distancia recorrida y el nivel de combustible restante
+    print("Mileage (OOP):", car.mileage)
+    print("Fuel Tank (OOP):", car.fuel_tank)
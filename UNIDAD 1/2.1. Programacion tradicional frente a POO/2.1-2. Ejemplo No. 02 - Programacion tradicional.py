@@ -22,10 +22,11 @@ def drive(distance):
     else:
         print("Not enough fuel to drive that far.")
 
-# Uso de las funciones en la programación tradicional
-fill_tank(20)
-drive(100)
+if __name__ == "__main__":
+    # Uso de las funciones en la programación tradicional
+    fill_tank(20)
+    drive(100)
 
-# Imprimir la distancia recorrida y el nivel de combustible restante
-print("Mileage (Traditional):", mileage)
-print("Fuel Tank (Traditional):", fuel_tank)
\ No newline at end of file
+    # Imprimir la distancia recorrida y el nivel de combustible restante
+    print("Mileage (Traditional):", mileage)
+    print("Fuel Tank (Traditional):", fuel_tank)
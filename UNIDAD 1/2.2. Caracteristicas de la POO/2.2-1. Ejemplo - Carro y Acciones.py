@@ -1,22 +1,160 @@
+import time
+from array import array
+from bisect import bisect_right
+from itertools import accumulate
+
+
+class LineaTiempoVelocidad:
+    """Registro compacto de eventos de aceleración y frenado de un carro.
+
+    Cada evento guarda su instante y el cambio de velocidad (positivo al
+    acelerar, negativo al frenar). Como 'frenar' aplica max(0, ...), la
+    velocidad tras el evento i es S[i] - min(0, S[0..i]), donde S es la suma
+    acumulada de los cambios; así se indexa sin repetir los eventos.
+    """
+
+    def __init__(self):
+        """Inicializa un registro vacío (velocidad 0 km/h)."""
+        self.instantes = array('d')
+        self.cambios = array('d')
+        self.velocidades = array('d')
+        self._suma = 0.0  # Suma acumulada de todos los cambios.
+        self._minimo = 0.0  # Mínimo de la suma acumulada (incluye el 0 inicial).
+        self._capacidad = 0  # Hojas del árbol de máximos (potencia de 2, se duplica al llenarse).
+        self._arbol = array('d')  # Árbol de segmentos de máximos sobre 'velocidades'.
+
+    def __len__(self):
+        return len(self.instantes)
+
+    def registrar(self, instante, cambio):
+        """Registra un evento; los instantes deben llegar en orden."""
+        self.registrar_eventos((instante,), (cambio,))
+
+    def registrar_eventos(self, instantes, cambios):
+        """Ingresa un lote de eventos (pueden ser millones) de una sola vez."""
+        nuevos_instantes = array('d', instantes)
+        nuevos_cambios = array('d', cambios)
+        if len(nuevos_instantes) != len(nuevos_cambios):
+            raise ValueError("Cada evento necesita un instante y un cambio.")
+        if not nuevos_instantes:
+            return
+        anterior = self.instantes[-1] if self.instantes else nuevos_instantes[0]
+        if nuevos_instantes[0] < anterior or any(
+                a > b for a, b in zip(nuevos_instantes, nuevos_instantes[1:])):
+            raise ValueError("Los instantes de los eventos deben estar en orden.")
+
+        sumas = list(accumulate(nuevos_cambios, initial=self._suma))[1:]
+        minimos = list(accumulate(sumas, min, initial=self._minimo))[1:]
+        inicio = len(self.velocidades)
+        self.instantes.extend(nuevos_instantes)
+        self.cambios.extend(nuevos_cambios)
+        self.velocidades.extend(map(float.__sub__, sumas, minimos))
+        self._suma = sumas[-1]
+        self._minimo = minimos[-1]
+        self._extender_arbol(inicio)
+
+    def _extender_arbol(self, inicio):
+        # Agrega al árbol las velocidades desde 'inicio': O(k + log n) para k eventos nuevos.
+        total = len(self.velocidades)
+        if total > self._capacidad:
+            # Sin espacio: se duplica la capacidad y se reconstruye (costo amortizado O(1) por evento).
+            capacidad = max(1, self._capacidad)
+            while capacidad < total:
+                capacidad *= 2
+            arbol = array('d', bytes(8 * capacidad)) + self.velocidades
+            arbol.extend(bytes(8 * (capacidad - total)))
+            for i in range(capacidad - 1, 0, -1):
+                arbol[i] = max(arbol[2 * i], arbol[2 * i + 1])
+            self._capacidad = capacidad
+            self._arbol = arbol
+            return
+        arbol = self._arbol
+        capacidad = self._capacidad
+        arbol[capacidad + inicio:capacidad + total] = self.velocidades[inicio:]
+        bajo = (capacidad + inicio) >> 1
+        alto = (capacidad + total - 1) >> 1
+        while bajo:
+            for i in range(bajo, alto + 1):
+                arbol[i] = max(arbol[2 * i], arbol[2 * i + 1])
+            bajo >>= 1
+            alto >>= 1
+
+    def velocidad_final(self):
+        """Devuelve la velocidad después del último evento."""
+        return self._suma - self._minimo
+
+    def velocidad_en(self, instante):
+        """Devuelve la velocidad en un instante, en O(log n)."""
+        posicion = bisect_right(self.instantes, instante) - 1
+        return self.velocidades[posicion] if posicion >= 0 else 0.0
+
+    def velocidad_maxima(self, desde, hasta):
+        """Devuelve la velocidad máxima alcanzada entre dos instantes, en O(log n)."""
+        if hasta < desde:
+            raise ValueError("El intervalo está invertido.")
+        inicio = bisect_right(self.instantes, desde) - 1
+        fin = bisect_right(self.instantes, hasta) - 1
+        maxima = self.velocidades[inicio] if inicio >= 0 else 0.0
+        if fin > inicio:
+            maxima = max(maxima, self._maximo_en_rango(inicio + 1, fin + 1))
+        return maxima
+
+    def _maximo_en_rango(self, inicio, fin):
+        # Consulta iterativa en el árbol de segmentos (rango [inicio, fin)).
+        arbol = self._arbol
+        maxima = 0.0
+        inicio += self._capacidad
+        fin += self._capacidad
+        while inicio < fin:
+            if inicio & 1:
+                maxima = max(maxima, arbol[inicio])
+                inicio += 1
+            if fin & 1:
+                fin -= 1
+                maxima = max(maxima, arbol[fin])
+            inicio >>= 1
+            fin >>= 1
+        return maxima
+
+
 class Carro:
     def __init__(self, color, marca, modelo):
         self.color = color
         self.marca = marca
         self.modelo = modelo
         self.velocidad = 0
+        self.historial = LineaTiempoVelocidad()
 
-    def acelerar(self, incremento):
+    def acelerar(self, incremento, instante=None):
         """Aumenta la velocidad del carro."""
+        if incremento < 0:
+            raise ValueError("El incremento no puede ser negativo; use frenar().")
+        # Primero el historial: si el instante está fuera de orden, la velocidad no cambia.
+        self.historial.registrar(self._instante(instante), incremento)
         self.velocidad += incremento
         print(f"El {self.marca} {self.modelo} aceleró a {self.velocidad} km/h")
 
-    def frenar(self, decremento):
+    def frenar(self, decremento, instante=None):
         """Disminuye la velocidad del carro."""
+        if decremento < 0:
+            raise ValueError("El decremento no puede ser negativo; use acelerar().")
+        self.historial.registrar(self._instante(instante), -decremento)
         self.velocidad = max(0, self.velocidad - decremento)
         print(f"El {self.marca} {self.modelo} frenó a {self.velocidad} km/h")
 
-# Ejemplo de creación y uso de un objeto Carro
-mi_carro = Carro('rojo', 'Toyota', 'Corolla')
-mi_carro.acelerar(20)
-mi_carro.frenar(10)
-print(f'La velocidad final de mi carro es: {mi_carro.velocidad} km/h')
\ No newline at end of file
+    @staticmethod
+    def _instante(instante):
+        # Reloj monotónico: un ajuste del reloj del sistema no desordena el historial.
+        return time.monotonic() if instante is None else instante
+
+    def cargar_eventos(self, instantes, cambios):
+        """Registra en bloque eventos de aceleración (+) y frenado (-) sin imprimir."""
+        self.historial.registrar_eventos(instantes, cambios)
+        self.velocidad = self.historial.velocidad_final()
+
+if __name__ == "__main__":
+    # Ejemplo de creación y uso de un objeto Carro
+    mi_carro = Carro('rojo', 'Toyota', 'Corolla')
+    mi_carro.acelerar(20)
+    mi_carro.frenar(10)
+    print(f'La velocidad final de mi carro es: {mi_carro.velocidad} km/h')
@@ -3,13 +3,32 @@ class Carro:
         self.modelo = modelo
         self.anio = anio
         self.conductor = None  # Inicialmente, el carro no tiene conductor
+        # Copia del nombre tomada al asignar, para no buscarlo en cada __str__. Si la persona
+        # cambia de nombre, el carro muestra el anterior hasta que se vuelva a asignar.
+        self._nombre_conductor = "nadie"
+        self._registro = None  # RegistroAsignaciones al que pertenece, si hay uno
 
     def asignar_conductor(self, persona):
-        if isinstance(persona, Persona):
-            self.conductor = persona
+        if not isinstance(persona, Persona):
+            return
+        if self._registro is not None:
+            # El registro mantiene sus índices y luego fija el conductor.
+            self._registro.asignar(self, persona)
+        else:
+            self._fijar_conductor(persona)
+
+    def quitar_conductor(self):
+        if self._registro is not None:
+            self._registro.desasignar(self)
+        else:
+            self._fijar_conductor(None)
+
+    def _fijar_conductor(self, persona):
+        self.conductor = persona
+        self._nombre_conductor = persona.nombre if persona is not None else "nadie"
 
     def __str__(self):
-        return f'Carro {self.modelo} del año {self.anio}, conducido por {self.conductor.nombre if self.conductor else "nadie"}.'
+        return f'Carro {self.modelo} del año {self.anio}, conducido por {self._nombre_conductor}.'
 
 
 class Persona:
@@ -21,15 +40,90 @@ class Persona:
         return f'Persona {self.nombre} con licencia número {self.licencia}.'
 
 
-# Creación de objetos
-carro1 = Carro('Corolla', 1998)
-carro2 = Carro('Blazer', 1997)
-persona = Persona('Laura', 3)
+class RegistroAsignaciones:
+    """Registro de qué persona conduce cada carro, con índices en ambos sentidos.
+
+    Un carro registrado avisa al registro cuando se llama a su asignar_conductor
+    o quitar_conductor, así los índices no quedan desactualizados.
+    """
+
+    def __init__(self):
+        self.conductor_por_carro = {}  # carro -> persona
+        self.carros_por_conductor = {}  # persona -> conjunto de carros
+        self.persona_por_licencia = {}  # licencia -> persona
+        self.carros_sin_conductor = set()
+
+    def registrar_carro(self, carro):
+        if carro._registro is self:
+            return
+        if carro._registro is not None:
+            raise ValueError(f'El carro {carro.modelo} ya pertenece a otro registro.')
+        if carro.conductor is not None:
+            # Primero la persona: si su licencia choca, el carro queda sin registrar.
+            self.registrar_persona(carro.conductor)
+        carro._registro = self
+        if carro.conductor is not None:
+            self.conductor_por_carro[carro] = carro.conductor
+            self.carros_por_conductor[carro.conductor].add(carro)
+        else:
+            self.carros_sin_conductor.add(carro)
+
+    def registrar_persona(self, persona):
+        registrada = self.persona_por_licencia.get(persona.licencia)
+        if registrada is not None and registrada is not persona:
+            raise ValueError(f'La licencia {persona.licencia} ya pertenece a {registrada.nombre}.')
+        self.persona_por_licencia[persona.licencia] = persona
+        self.carros_por_conductor.setdefault(persona, set())
+
+    def asignar(self, carro, persona):
+        if not isinstance(persona, Persona):
+            raise TypeError('Solo se puede asignar un objeto Persona como conductor.')
+        self.registrar_carro(carro)
+        self.registrar_persona(persona)
+        self.desasignar(carro)
+        self.carros_sin_conductor.discard(carro)
+        carro._fijar_conductor(persona)
+        self.conductor_por_carro[carro] = persona
+        self.carros_por_conductor[persona].add(carro)
+
+    def desasignar(self, carro):
+        self.registrar_carro(carro)
+        persona = self.conductor_por_carro.pop(carro, None)
+        if persona is not None:
+            self.carros_por_conductor[persona].discard(carro)
+        carro._fijar_conductor(None)
+        self.carros_sin_conductor.add(carro)
+
+    def asignar_varios(self, pares):
+        """Asigna en bloque una secuencia de pares (carro, persona)."""
+        for carro, persona in pares:
+            self.asignar(carro, persona)
+
+    def desasignar_varios(self, carros):
+        for carro in carros:
+            self.desasignar(carro)
+
+    def conductor_de(self, carro):
+        return self.conductor_por_carro.get(carro)
+
+    def carros_de(self, persona):
+        # Copia inmutable: modificarla no debe alterar el índice.
+        return frozenset(self.carros_por_conductor.get(persona, ()))
+
+    def buscar_por_licencia(self, licencia):
+        return self.persona_por_licencia.get(licencia)
+
+
+if __name__ == "__main__":
+    # Creación de objetos
+    carro1 = Carro('Corolla', 1998)
+    carro2 = Carro('Blazer', 1997)
+    persona = Persona('Laura', 3)
 
-# Asignar un conductor al carro
-carro1.asignar_conductor(persona)
+    # Asignar un conductor al carro
+    carro1.asignar_conductor(persona)
 
-# Ejemplo de salida
-print(carro1)  # Debería imprimir: Carro Corolla del año 1998, conducido por Laura.
-print(carro2)  # Debería imprimir: Carro Blazer del año 1997, conducido por nadie.
-print(persona)  # Debería imprimir: Persona Laura con licencia número 3.
\ No newline at end of file
+    # Ejemplo de salida
+    print(carro1)  # Debería imprimir: Carro Corolla del año 1998, conducido por Laura.
+    print(carro2)  # Debería imprimir: Carro Blazer del año 1997, conducido por nadie.
+    print(persona)  # Debería imprimir: Persona Laura con licencia número 3.
@@ -20,8 +20,9 @@ class Carro:
         return f"Carro: {self.marca} {self.modelo}, Color: {self.color}, Velocidad: {self.velocidad} km/h"
 
 
-# Ejemplo de creación y uso de un objeto Carro
-mi_carro = Carro('rojo', 'Toyota', 'Corolla')
+if __name__ == "__main__":
+    # Ejemplo de creación y uso de un objeto Carro
+    mi_carro = Carro('rojo', 'Toyota', 'Corolla')
 
-# Llamada al método __str__
-print(mi_carro)  # Esto llamará automáticamente al método __str__ y mostrará la información del carro
\ No newline at end of file
+    # Llamada al método __str__
+    print(mi_carro)  # Esto llamará automáticamente al método __str__ y mostrará la información del carro
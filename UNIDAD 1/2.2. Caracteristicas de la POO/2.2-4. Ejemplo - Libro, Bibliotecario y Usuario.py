@@ -1,3 +1,9 @@
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+
+LOAN_DAYS = 14  # Días de préstamo por defecto.
+
+
 class Book:
     """Representa un libro en la biblioteca."""
 
@@ -7,36 +13,106 @@ class Book:
         self.author = author
         self.isbn = isbn
         self.is_borrowed = False
+        self.due_date = None
+        self.loan_index = None  # LoanIndex donde está registrado su préstamo, si lo hay.
 
-    def borrow(self):
+    def borrow(self, due_date=None):
         """Presta el libro si no está actualmente prestado."""
         if not self.is_borrowed:
             self.is_borrowed = True
+            self.due_date = due_date
             return True
         return False
 
     def return_book(self):
         """Devuelve el libro a la biblioteca."""
         self.is_borrowed = False
+        self.due_date = None
+        if self.loan_index is not None:
+            # Se quita del índice donde se prestó, aunque lo reciba otro bibliotecario.
+            self.loan_index.remove(self)
 
     def __str__(self):
         """Devuelve una representación en cadena del libro."""
         return f"{self.title} by {self.author}, ISBN: {self.isbn}"
 
 
+class LoanIndex:
+    """Préstamos activos agrupados por fecha de vencimiento (un cubo por día)."""
+
+    def __init__(self):
+        """Inicializa un índice vacío."""
+        self.buckets = {}  # día (ordinal) -> {libro: usuario}
+        self.days = []  # Días con préstamos, ordenados.
+        self.due_day_by_book = {}
+
+    def __len__(self):
+        """Devuelve la cantidad de préstamos activos."""
+        return len(self.due_day_by_book)
+
+    def add(self, book, user, due_date):
+        """Registra un préstamo en el cubo de su fecha de vencimiento."""
+        if book.loan_index is not None:
+            book.loan_index.remove(book)
+        day = due_date.toordinal()
+        bucket = self.buckets.get(day)
+        if bucket is None:
+            bucket = self.buckets[day] = {}
+            insort(self.days, day)
+        bucket[book] = user
+        self.due_day_by_book[book] = day
+        book.loan_index = self
+
+    def remove(self, book):
+        """Quita un préstamo en O(1); el día solo se borra si su cubo queda vacío."""
+        day = self.due_day_by_book.pop(book, None)
+        if day is None:
+            return
+        book.loan_index = None
+        bucket = self.buckets[day]
+        del bucket[book]
+        if not bucket:
+            del self.buckets[day]
+            del self.days[bisect_left(self.days, day)]
+
+    def overdue(self, today=None):
+        """Devuelve una lista de (libro, usuario, vencimiento) de los préstamos vencidos antes de hoy.
+
+        Solo recorre los cubos de días pasados, que nunca están vacíos, así que
+        el costo depende de los préstamos vencidos y no del total de préstamos.
+        Es una lista y no un generador: se pueden devolver los libros mientras
+        se recorre el resultado sin alterar la iteración.
+        """
+        today = (today or date.today()).toordinal()
+        return [
+            (book, user, date.fromordinal(day))
+            for day in self.days[:bisect_left(self.days, today)]
+            for book, user in self.buckets[day].items()
+        ]
+
 class Librarian:
     """Representa un bibliotecario en la biblioteca."""
 
-    def __init__(self, name):
-        """Inicializa un nuevo bibliotecario con un nombre."""
+    def __init__(self, name, loans=None):
+        """Inicializa un nuevo bibliotecario con un nombre.
+
+        Varios bibliotecarios pueden compartir el mismo índice 'loans'
+        para tener los préstamos de toda la biblioteca en un solo lugar.
+        """
         self.name = name
+        self.loans = loans if loans is not None else LoanIndex()
 
-    def manage_book(self, book, action):
+    def manage_book(self, book, action, user=None, due_date=None):
         """Gestiona las acciones de prestar o devolver un libro."""
         if action == 'borrow':
-            return book.borrow()
+            if due_date is None:
+                due_date = date.today() + timedelta(days=LOAN_DAYS)
+            if book.borrow(due_date):
+                self.loans.add(book, user, due_date)
+                return True
+            return False
         elif action == 'return':
-            book.return_book()
+            book.return_book()  # También lo quita del índice donde se registró el préstamo.
 
 
 class User:
@@ -47,9 +123,9 @@ class User:
         self.name = name
         self.borrowed_books = []
 
-    def borrow_book(self, book, librarian):
+    def borrow_book(self, book, librarian, due_date=None):
         """Permite al usuario pedir prestado un libro."""
-        if librarian.manage_book(book, 'borrow'):
+        if librarian.manage_book(book, 'borrow', self, due_date):
             self.borrowed_books.append(book)
             print(f"{self.name} ha pedido prestado el libro: {book.title}")
         else:
@@ -65,10 +141,11 @@ class User:
             print(f"{self.name} no tiene el libro: {book.title}")
 
 
-# Ejemplo de uso
-libro1 = Book("Cien años de soledad", "Gabriel García Márquez", "1234567890")
-bibliotecario = Librarian("Juan")
-usuario = User("Ana")
+if __name__ == "__main__":
+    # Ejemplo de uso
+    libro1 = Book("Cien años de soledad", "Gabriel García Márquez", "1234567890")
+    bibliotecario = Librarian("Juan")
+    usuario = User("Ana")
 
-usuario.borrow_book(libro1, bibliotecario)  # Ana pide prestado el libro
-usuario.return_book(libro1, bibliotecario)  # Ana devuelve el libro
\ No newline at end of file
+    usuario.borrow_book(libro1, bibliotecario)  # Ana pide prestado el libro
+    usuario.return_book(libro1, bibliotecario)  # Ana devuelve el libro
@@ -63,12 +63,13 @@ class Person:
                 book.return_book()
 
 
-# Ejemplo de uso
-libro1 = Book("Cien años de soledad", "Gabriel García Márquez", "1234567890")
-bibliotecario = Person("Juan", "librarian")
-usuario = Person("Ana", "user")
+if __name__ == "__main__":
+    # Ejemplo de uso
+    libro1 = Book("Cien años de soledad", "Gabriel García Márquez", "1234567890")
+    bibliotecario = Person("Juan", "librarian")
+    usuario = Person("Ana", "user")
 
-usuario.borrow_book(libro1)  # Ana pide prestado el libro
-usuario.return_book(libro1)  # Ana devuelve el libro
+    usuario.borrow_book(libro1)  # Ana pide prestado el libro
+    usuario.return_book(libro1)  # Ana devuelve el libro
 
-print(libro1)
\ No newline at end of file
+    print(libro1)
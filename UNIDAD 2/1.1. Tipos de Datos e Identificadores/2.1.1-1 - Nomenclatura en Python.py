@@ -1,10 +1,15 @@
 # Ejemplo de Convenciones de Nomenclatura en Python
 
+import heapq
+from functools import lru_cache
+
 # Clases: CamelCase (cada palabra comienza con mayúscula)
 class VehiculoElectrico:
-    def __init__(self, marca, modelo):
+    def __init__(self, marca, modelo, rendimiento=3.5, energia=100):
         self.marca = marca
         self.modelo = modelo
+        self.rendimiento = rendimiento  # km por kWh
+        self.energia = energia  # kWh disponibles
 
     def mostrar_informacion(self):
         return f"Vehículo Eléctrico: {self.marca} {self.modelo}"
@@ -15,12 +20,111 @@ def calcular_distancia(rendimiento, energia):
 
 # Constantes: MAYUSCULAS con guiones bajos
 MAX_ENERGIA = 100
+CANTIDAD_PUNTOS_REFERENCIA = 4
+TAMANO_CACHE_RUTAS = 65536
+
+# Lee un grafo de carreteras desde un archivo con líneas "origen,destino,km".
+# Las carreteras son de doble sentido; las líneas vacías o con '#' se ignoran.
+def cargar_grafo_carreteras(ruta_archivo):
+    grafo = {}
+    with open(ruta_archivo, encoding="utf-8") as archivo:
+        for linea in archivo:
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            origen, destino, kilometros = (campo.strip() for campo in linea.split(","))
+            kilometros = float(kilometros)
+            grafo.setdefault(origen, []).append((destino, kilometros))
+            grafo.setdefault(destino, []).append((origen, kilometros))
+    return grafo
+
+
+def distancias_desde(grafo, origen):
+    distancias = {origen: 0.0}
+    pendientes = [(0.0, origen)]
+    while pendientes:
+        distancia, nodo = heapq.heappop(pendientes)
+        if distancia > distancias[nodo]:
+            continue
+        for vecino, kilometros in grafo.get(nodo, ()):
+            nueva_distancia = distancia + kilometros
+            if nueva_distancia < distancias.get(vecino, float("inf")):
+                distancias[vecino] = nueva_distancia
+                heapq.heappush(pendientes, (nueva_distancia, vecino))
+    return distancias
+
+
+# Responde si un vehículo eléctrico llega de A a B con su energía.
+# Usa A* con cotas inferiores de puntos de referencia (landmarks) y guarda las
+# distancias mínimas en una caché LRU: la distancia no depende del vehículo,
+# así que cada par (origen, destino) sirve para toda la flota.
+class PlanificadorAutonomia:
+    def __init__(self, grafo, cantidad_referencias=CANTIDAD_PUNTOS_REFERENCIA, tamano_cache=TAMANO_CACHE_RUTAS):
+        self.grafo = grafo
+        self.referencias = self._elegir_referencias(cantidad_referencias)
+        self.distancia_minima = lru_cache(maxsize=tamano_cache)(self._buscar_distancia_minima)
+
+    @classmethod
+    def desde_archivo(cls, ruta_archivo, **opciones):
+        return cls(cargar_grafo_carreteras(ruta_archivo), **opciones)
+
+    def puede_llegar(self, vehiculo, origen, destino):
+        alcance = calcular_distancia(vehiculo.rendimiento, vehiculo.energia)
+        return self.distancia_minima(origen, destino) <= alcance
+
+    def energia_necesaria(self, vehiculo, origen, destino):
+        return self.distancia_minima(origen, destino) / vehiculo.rendimiento
+
+    def _elegir_referencias(self, cantidad):
+        # Elige referencias alejadas entre sí: cada nueva es el nodo más lejano a las anteriores.
+        referencias = []
+        if not self.grafo or cantidad <= 0:
+            return referencias
+        cercania = {}
+        candidato = next(iter(self.grafo))
+        while len(referencias) < cantidad:
+            distancias = distancias_desde(self.grafo, candidato)
+            referencias.append(distancias)
+            for nodo, distancia in distancias.items():
+                cercania[nodo] = min(cercania.get(nodo, float("inf")), distancia)
+            candidato = max(cercania, key=cercania.get)
+            if cercania[candidato] == 0:
+                break
+        return referencias
+
+    def _cota_inferior(self, nodo, destino):
+        # Desigualdad triangular: |d(R, destino) - d(R, nodo)| <= d(nodo, destino).
+        cota = 0.0
+        for distancias in self.referencias:
+            if nodo in distancias and destino in distancias:
+                cota = max(cota, abs(distancias[destino] - distancias[nodo]))
+        return cota
+
+    def _buscar_distancia_minima(self, origen, destino):
+        if origen not in self.grafo or destino not in self.grafo:
+            return float("inf")
+        distancias = {origen: 0.0}
+        pendientes = [(self._cota_inferior(origen, destino), 0.0, origen)]
+        while pendientes:
+            _, distancia, nodo = heapq.heappop(pendientes)
+            if nodo == destino:
+                return distancia
+            if distancia > distancias[nodo]:
+                continue
+            for vecino, kilometros in self.grafo[nodo]:
+                nueva_distancia = distancia + kilometros
+                if nueva_distancia < distancias.get(vecino, float("inf")):
+                    distancias[vecino] = nueva_distancia
+                    estimado = nueva_distancia + self._cota_inferior(vecino, destino)
+                    heapq.heappush(pendientes, (estimado, nueva_distancia, vecino))
+        return float("inf")
 
-# Instancia de la clase
-mi_tesla = VehiculoElectrico("Tesla", "Model 3")
+if __name__ == "__main__":
+    # Instancia de la clase
+    mi_tesla = VehiculoElectrico("Tesla", "Model 3")
 
-# Llamada a función
-distancia = calcular_distancia(3.5, MAX_ENERGIA)
+    # Llamada a función
+    distancia = calcular_distancia(3.5, MAX_ENERGIA)
 
-print(mi_tesla.mostrar_informacion())
-print(f"Distancia máxima posible: {distancia} km")
\ No newline at end of file
+    print(mi_tesla.mostrar_informacion())
+    print(f"Distancia máxima posible: {distancia} km")
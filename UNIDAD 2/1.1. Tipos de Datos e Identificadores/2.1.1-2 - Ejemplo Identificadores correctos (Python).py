@@ -1,5 +1,7 @@
 # Ejemplo de Buenos Identificadores en Python
 
+from array import array
+
 # Buen identificador para una variable que almacena la cantidad de estudiantes en una clase
 cantidad_estudiantes = 25
 
@@ -8,11 +10,91 @@ def crear_usuario(nombre, edad):
     nuevo_usuario = {'nombre': nombre, 'edad': edad}
     return nuevo_usuario
 
+# Buen identificador para una constante: la edad más alta que cabe en el arreglo 'H'
+EDAD_MAXIMA = 65535
+
+# Buen identificador para una clase que guarda muchos usuarios de forma compacta:
+# los nombres repetidos se guardan una sola vez y las edades en un arreglo tipado.
+class AlmacenUsuarios:
+    def __init__(self):
+        self.nombres_unicos = []  # Tabla de nombres sin repetir.
+        self.indice_por_nombre = {}  # nombre -> posición en nombres_unicos
+        self.nombre_de_usuario = array('I')  # Posición del nombre de cada usuario.
+        self.edad_de_usuario = array('H')  # Edad de cada usuario (0 a 65535).
+
+    def __len__(self):
+        return len(self.edad_de_usuario)
+
+    def __getitem__(self, posicion):
+        if not -len(self) <= posicion < len(self):
+            raise IndexError("No existe un usuario en esa posición.")
+        return VistaUsuario(self, posicion % len(self))
+
+    def __iter__(self):
+        for posicion in range(len(self)):
+            yield VistaUsuario(self, posicion)
+
+    def crear_usuario(self, nombre, edad):
+        self.crear_usuarios(((nombre, edad),))
+        return VistaUsuario(self, len(self) - 1)
+
+    def crear_usuarios(self, pares_nombre_edad):
+        indice_por_nombre = self.indice_por_nombre
+        nombres_unicos = self.nombres_unicos
+        cantidad_nombres_previa = len(nombres_unicos)
+        posiciones_nombres = array('I')
+        edades = array('H')
+        try:
+            for nombre, edad in pares_nombre_edad:
+                # La edad se valida antes de guardar el nombre, para no dejar nombres sin usuario.
+                # bool es subclase de int, pero True/False no son edades.
+                if not isinstance(edad, int) or isinstance(edad, bool) or not 0 <= edad <= EDAD_MAXIMA:
+                    raise ValueError(f"La edad debe ser un entero entre 0 y {EDAD_MAXIMA} (se recibió {edad!r}).")
+                posicion_nombre = indice_por_nombre.get(nombre)
+                if posicion_nombre is None:
+                    posicion_nombre = indice_por_nombre[nombre] = len(nombres_unicos)
+                    nombres_unicos.append(nombre)
+                posiciones_nombres.append(posicion_nombre)
+                edades.append(edad)
+        except BaseException:
+            # Si falla una fila del lote (por cualquier error) no se guarda ninguna: se descartan los nombres nuevos.
+            for nombre in nombres_unicos[cantidad_nombres_previa:]:
+                del indice_por_nombre[nombre]
+            del nombres_unicos[cantidad_nombres_previa:]
+            raise
+        self.nombre_de_usuario.extend(posiciones_nombres)
+        self.edad_de_usuario.extend(edades)
+
+# Buen identificador para la vista liviana de un usuario: se lee igual que el
+# diccionario de crear_usuario (usuario['nombre'], usuario['edad']).
+class VistaUsuario:
+    __slots__ = ('almacen', 'posicion')
+
+    def __init__(self, almacen, posicion):
+        self.almacen = almacen
+        self.posicion = posicion
+
+    def __getitem__(self, campo):
+        if campo == 'nombre':
+            return self.almacen.nombres_unicos[self.almacen.nombre_de_usuario[self.posicion]]
+        if campo == 'edad':
+            return self.almacen.edad_de_usuario[self.posicion]
+        raise KeyError(campo)
+
+    def __eq__(self, otro):
+        if isinstance(otro, (VistaUsuario, dict)):
+            return self['nombre'] == otro['nombre'] and self['edad'] == otro['edad']
+        return NotImplemented
+
+    def __repr__(self):
+        return repr({'nombre': self['nombre'], 'edad': self['edad']})
+
 # Buen identificador para una variable que almacena el precio total de una compra
 precio_total = 99.99
 
-# Uso de los identificadores en un contexto de código
-print(f"Cantidad de estudiantes: {cantidad_estudiantes}")
-usuario = crear_usuario("Laura", 30)
-print(f"Usuario creado: {usuario['nombre']} con edad {usuario['edad']}")
-print(f"Precio total de la compra: {precio_total}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Uso de los identificadores en un contexto de código
+    print(f"Cantidad de estudiantes: {cantidad_estudiantes}")
+    usuario = crear_usuario("Laura", 30)
+    print(f"Usuario creado: {usuario['nombre']} con edad {usuario['edad']}")
+    print(f"Precio total de la compra: {precio_total}")
@@ -11,8 +11,9 @@ def funcion1(param1, param2):
 # Identificador vago para una variable
 p = 75.0
 
-# Uso de los identificadores en un contexto de código
-print(f"Valor de cnt: {cnt}")
-resultado_funcion = funcion1(10, 20)
-print(f"Resultado de funcion1: {resultado_funcion}")
-print(f"Valor de p: {p}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Uso de los identificadores en un contexto de código
+    print(f"Valor de cnt: {cnt}")
+    resultado_funcion = funcion1(10, 20)
+    print(f"Resultado de funcion1: {resultado_funcion}")
+    print(f"Valor de p: {p}")
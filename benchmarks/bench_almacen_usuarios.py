@@ -0,0 +1,78 @@
+# Compara memoria y tiempo de lectura entre una lista de diccionarios creados
+#  con crear_usuario y el AlmacenUsuarios compacto.
+#  Uso: python benchmarks/bench_almacen_usuarios.py [cantidad_usuarios]
+
+import pathlib
+import random
+import sys
+import time
+import tracemalloc
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402
+
+NOMBRES = ["Laura", "Ana", "Juan", "Diego", "Elvio", "María", "José", "Carmen", "Luis", "Sofía"]
+
+
+def filas_de_ejemplo(cantidad):
+    # Simula filas leídas de un archivo: cada nombre es un objeto str nuevo.
+    random.seed(2025)
+    for numero in range(cantidad):
+        nombre = f"{random.choice(NOMBRES)} {numero % 5000}"
+        yield nombre, random.randint(18, 90)
+
+
+def medir(funcion):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, segundos, memoria
+
+
+def recorrer(usuarios):
+    inicio = time.perf_counter()
+    total_edades = 0
+    for usuario in usuarios:
+        usuario['nombre']
+        total_edades += usuario['edad']
+    return time.perf_counter() - inicio
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    identificadores = poo_uea.identificadores
+
+    lista, segundos_lista, memoria_lista = medir(
+        lambda: [identificadores.crear_usuario(nombre, edad) for nombre, edad in filas_de_ejemplo(cantidad)])
+    del lista
+
+    def crear_almacen():
+        almacen = identificadores.AlmacenUsuarios()
+        almacen.crear_usuarios(filas_de_ejemplo(cantidad))
+        return almacen
+    almacen, segundos_almacen, memoria_almacen = medir(crear_almacen)
+
+    lista = [identificadores.crear_usuario(nombre, edad) for nombre, edad in filas_de_ejemplo(cantidad)]
+    print(f"{'':<22}{'dict':>14}{'AlmacenUsuarios':>18}")
+    print(f"{'memoria (MiB)':<22}{memoria_lista / 2**20:>14.1f}{memoria_almacen / 2**20:>18.1f}")
+    print(f"{'creación (s)':<22}{segundos_lista:>14.2f}{segundos_almacen:>18.2f}")
+    print(f"{'recorrido (s)':<22}{recorrer(lista):>14.2f}{recorrer(almacen):>18.2f}")
+    posiciones = [random.randrange(cantidad) for _ in range(100_000)]
+    inicio = time.perf_counter()
+    for posicion in posiciones:
+        lista[posicion]['edad']
+    tiempo_lista = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    for posicion in posiciones:
+        almacen[posicion]['edad']
+    tiempo_almacen = time.perf_counter() - inicio
+    print(f"{'acceso aleatorio (µs)':<22}{tiempo_lista / len(posiciones) * 1e6:>14.3f}"
+          f"{tiempo_almacen / len(posiciones) * 1e6:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
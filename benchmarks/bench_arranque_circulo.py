@@ -0,0 +1,55 @@
+# Mide el tiempo de arranque en frío de la calculadora de áreas de círculos.
+#  Compara un intérprete vacío ('python -c pass') con la interfaz de comandos
+#  ('area --radius') y mide la latencia por pedido del modo trabajador.
+#  Uso: python benchmarks/bench_arranque_circulo.py [repeticiones]
+
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+PROGRAMA = RAIZ_REPO / "CalcularElAreaDelCírculo_POO" / "CalcularElAreaDelCírculo.py"
+
+
+def medir_comando(comando, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(comando, check=True, stdout=subprocess.DEVNULL)
+        tiempos.append(time.perf_counter() - inicio)
+    return tiempos
+
+
+def medir_trabajador(cantidad_pedidos):
+    proceso = subprocess.Popen([sys.executable, str(PROGRAMA), "worker"], stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, text=True, bufsize=1)
+    tiempos = []
+    for numero in range(1, cantidad_pedidos + 1):
+        inicio = time.perf_counter()
+        proceso.stdin.write(f"{numero}\n")
+        proceso.stdin.flush()
+        proceso.stdout.readline()
+        tiempos.append(time.perf_counter() - inicio)
+    proceso.stdin.close()
+    proceso.wait()
+    return tiempos
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    casos = {
+        "python -c pass": [sys.executable, "-c", "pass"],
+        "area --radius 2": [sys.executable, str(PROGRAMA), "area", "--radius", "2"],
+    }
+    print(f"{'caso':<28}{'mediana (ms)':>14}{'mínimo (ms)':>14}")
+    for nombre, comando in casos.items():
+        tiempos = medir_comando(comando, repeticiones)
+        print(f"{nombre:<28}{statistics.median(tiempos) * 1e3:>14.2f}{min(tiempos) * 1e3:>14.2f}")
+    tiempos = medir_trabajador(repeticiones * 50)
+    print(f"{'worker (por pedido)':<28}{statistics.median(tiempos) * 1e3:>14.3f}{min(tiempos) * 1e3:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# Mide el costo de arranque en frío de cada clase exportada por poo_uea.
+#  Cada medición es un intérprete nuevo que hace 'import poo_uea' y accede a
+#  una sola clase, así que solo se carga el ejemplo que la define. Como
+#  referencia se mide también cargar todos los ejemplos a la vez.
+#  Uso: python benchmarks/bench_importacion.py [repeticiones]
+
+import pathlib
+import statistics
+import subprocess
+import sys
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402
+
+PLANTILLA = ("import time; inicio = time.perf_counter(); import poo_uea; {acceso}; "
+             "print(time.perf_counter() - inicio)")
+
+
+def medir(acceso, repeticiones):
+    codigo = PLANTILLA.format(acceso=acceso)
+    tiempos = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ_REPO, check=True,
+                                capture_output=True, text=True).stdout
+        tiempos.append(float(salida.strip().splitlines()[-1]))
+    return statistics.median(tiempos) * 1e3
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    print(f"{'acceso':<34}{'ejemplo':<22}{'mediana (ms)':>14}")
+    print(f"{'import poo_uea':<34}{'-':<22}{medir('pass', repeticiones):>14.2f}")
+    for nombre, ejemplo in sorted(poo_uea.EXPORTACIONES.items(), key=lambda par: (par[1], par[0])):
+        print(f"{'poo_uea.' + nombre:<34}{ejemplo:<22}{medir('poo_uea.' + nombre, repeticiones):>14.2f}")
+    todos = "; ".join(f"poo_uea.{ejemplo}" for ejemplo in poo_uea.RUTAS_EJEMPLOS)
+    print(f"{'todos los ejemplos':<34}{'-':<22}{medir(todos, repeticiones):>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
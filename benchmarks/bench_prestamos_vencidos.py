@@ -0,0 +1,59 @@
+# Compara el barrido nocturno de préstamos vencidos usando LoanIndex con
+#  recorrer la lista 'borrowed_books' de cada usuario.
+#  Uso: python benchmarks/bench_prestamos_vencidos.py [cantidad_prestamos]
+
+import contextlib
+import os
+import pathlib
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    biblioteca = poo_uea.biblioteca
+    random.seed(2025)
+    hoy = date(2025, 6, 1)
+    bibliotecario = biblioteca.Librarian("Juan")
+    usuarios = [biblioteca.User(f"Usuario {numero}") for numero in range(max(1, cantidad // 5))]
+
+    inicio = time.perf_counter()
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        for numero in range(cantidad):
+            libro = biblioteca.Book(f"Libro {numero}", "Autor", str(numero))
+            # Alrededor del 1 % de los préstamos ya está vencido.
+            vencimiento = hoy + timedelta(days=random.randint(-1, 98))
+            random.choice(usuarios).borrow_book(libro, bibliotecario, vencimiento)
+    print(f"Registro de {cantidad} préstamos: {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    vencidos_indice = list(bibliotecario.loans.overdue(hoy))
+    tiempo_indice = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    vencidos_recorrido = [(libro, usuario, libro.due_date) for usuario in usuarios
+                          for libro in usuario.borrowed_books if libro.due_date < hoy]
+    tiempo_recorrido = time.perf_counter() - inicio
+    assert len(vencidos_indice) == len(vencidos_recorrido)
+
+    libros_prestados = list(bibliotecario.loans.due_day_by_book)
+    muestra = random.sample(libros_prestados, min(10_000, len(libros_prestados)))
+    inicio = time.perf_counter()
+    for libro in muestra:
+        bibliotecario.loans.remove(libro)
+    tiempo_devolucion = (time.perf_counter() - inicio) / len(muestra)
+
+    print(f"Préstamos vencidos:             {len(vencidos_indice)}")
+    print(f"Barrido con LoanIndex:          {tiempo_indice * 1e3:10.2f} ms")
+    print(f"Barrido recorriendo usuarios:   {tiempo_recorrido * 1e3:10.2f} ms")
+    print(f"Quitar un préstamo del índice:  {tiempo_devolucion * 1e6:10.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Compara el ranking incremental (RankingEstudiantes) con ordenar a todos los
+#  estudiantes después de cada cambio de calificación.
+#  Uso: python benchmarks/bench_ranking_estudiantes.py [cantidad_estudiantes]
+
+import contextlib
+import io
+import os
+import pathlib
+import random
+import sys
+import time
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    semana_6 = poo_uea.universidad
+    random.seed(2025)
+    materia = semana_6.Materia("Programación Orientada a Objetos", "POO101", 4)
+
+    inicio = time.perf_counter()
+    estudiantes = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for numero in range(cantidad):
+            estudiante = semana_6.Estudiante("Nombre", str(numero), str(numero), "TICS")
+            estudiante.matricular_materia(materia)
+            estudiante.registrar_calificacion("POO101", random.randint(0, 100))
+            estudiantes.append(estudiante)
+    print(f"Creación de {cantidad} estudiantes: {time.perf_counter() - inicio:.2f} s")
+
+    inicio = time.perf_counter()
+    ranking = semana_6.RankingEstudiantes()
+    ranking.agregar_varios(estudiantes)
+    print(f"Carga masiva del ranking:        {time.perf_counter() - inicio:.2f} s")
+
+    cambios = 10_000
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        inicio = time.perf_counter()
+        for _ in range(cambios):
+            estudiante = random.choice(estudiantes)
+            estudiante.registrar_calificacion("POO101", random.randint(0, 100))
+            ranking.mejores(10)
+            ranking.posicion(estudiante)
+            ranking.percentil(estudiante)
+        tiempo_ranking = (time.perf_counter() - inicio) / cambios
+
+        cambios_ordenando = 5
+        inicio = time.perf_counter()
+        for _ in range(cambios_ordenando):
+            estudiante = random.choice(estudiantes)
+            estudiante.registrar_calificacion("POO101", random.randint(0, 100))
+            ordenados = sorted(estudiantes, key=semana_6.Estudiante.obtener_promedio_general, reverse=True)
+            ordenados[:10]
+            ordenados.index(estudiante)
+        tiempo_orden = (time.perf_counter() - inicio) / cambios_ordenando
+
+    print(f"Cambio + consultas (ranking):    {tiempo_ranking * 1e6:10.1f} µs")
+    print(f"Cambio + consultas (ordenando):  {tiempo_orden * 1e6:10.1f} µs")
+    print(f"Aceleración:                     {tiempo_orden / tiempo_ranking:10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+# Suite de benchmarks de los métodos más usados del repositorio.
+#  Usa las clases a través del paquete poo_uea (sin ejecutar demostraciones), ejecuta cada caso con
+#  varios tamaños (10^3 a 10^6 operaciones) y guarda en JSON las operaciones
+#  por segundo, los percentiles de latencia (sobre una muestra de hasta
+#  MUESTRAS_LATENCIA operaciones) y la memoria pico. Si se indica un
+#  archivo base, marca como regresión todo caso que sea más lento que la base.
+#
+#  Uso:
+#    python benchmarks/suite_rendimiento.py --salida resultados.json
+#    python benchmarks/suite_rendimiento.py --base resultados.json --tamanos 1000 10000
+#  Termina con código 1 si encuentra regresiones.
+
+import argparse
+import contextlib
+import datetime
+import json
+import os
+import pathlib
+import platform
+import sys
+import time
+import tracemalloc
+from array import array
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402  (los ejemplos se cargan al usarlos, sin ejecutar sus demostraciones)
+
+TAMANOS = (1_000, 10_000, 100_000, 1_000_000)
+TOLERANCIA = 0.20  # Se marca regresión si las operaciones por segundo caen más de un 20 %.
+MUESTRAS_LATENCIA = 10_000  # Operaciones medidas una por una para los percentiles.
+
+
+# --- Casos: cada uno prepara el estado y devuelve la operación a medir ---
+
+def preparar_sensor(cantidad):
+    sensores = poo_uea.sensores
+    sensor = sensores.Sensor("T_001", "Temperatura", "°C", 22.8)
+    # Sin el retardo simulado de hardware: se mide solo el costo del método. Se anula en la
+    # instancia, así la clase Sensor compartida conserva su retardo después del caso.
+    sensor.RETARDO_LECTURA = 0
+    return lambda numero: sensor.leer_valor()
+
+
+def preparar_estudiante(cantidad):
+    universidad = poo_uea.universidad
+    materia = universidad.Materia("Programación Orientada a Objetos", "POO101", 4)
+    # Unas diez notas por estudiante, para no medir listas de notas gigantes.
+    estudiantes = []
+    for numero in range(max(1, cantidad // 10)):
+        estudiante = universidad.Estudiante("Nombre", "Apellido", str(numero), "TICS")
+        estudiante.matricular_materia(materia)
+        estudiantes.append(estudiante)
+    total = len(estudiantes)
+    return lambda numero: estudiantes[numero % total].registrar_calificacion("POO101", numero % 101)
+
+
+def preparar_combate(cantidad):
+    personajes = poo_uea.personajes
+
+    def operacion(numero):
+        guerrero = personajes.Guerrero("Guts", 20, 10, 4, 100, 4)
+        mago = personajes.Mago("Vanessa", 5, 15, 4, 100, 3)
+        personajes.combate(guerrero, mago)
+    return operacion
+
+
+def preparar_biblioteca(cantidad):
+    biblioteca = poo_uea.biblioteca
+    bibliotecario = biblioteca.Librarian("Juan")
+    usuario = biblioteca.User("Ana")
+    libros = [biblioteca.Book(f"Libro {numero}", "Autor", str(numero)) for numero in range(1000)]
+
+    def operacion(numero):
+        libro = libros[numero % len(libros)]
+        usuario.borrow_book(libro, bibliotecario)
+        usuario.return_book(libro, bibliotecario)
+    return operacion
+
+
+def preparar_banco(cantidad):
+    banco = poo_uea.banco
+    # Tasa 0 para que el saldo no crezca sin límite durante millones de operaciones.
+    cuenta = banco.BankAccount(1000, 0.0)
+
+    def operacion(numero):
+        cuenta.deposit(100)
+        cuenta.withdraw(100)
+        cuenta.calculate_interest()
+    return operacion
+
+
+def preparar_vehiculo(cantidad):
+    vehiculo = poo_uea.vehiculo.Vehicle()
+
+    def operacion(numero):
+        vehiculo.fill_tank(4)
+        vehiculo.drive(100)
+    return operacion
+
+
+def preparar_circulo(cantidad):
+    calcular_area_circulo = poo_uea.circulo.calcular_area_circulo
+    return lambda numero: calcular_area_circulo(numero + 1.0)
+
+
+CASOS = {
+    "Sensor.leer_valor": preparar_sensor,
+    "Estudiante.registrar_calificacion": preparar_estudiante,
+    "combate": preparar_combate,
+    "Book.borrow+User.return_book": preparar_biblioteca,
+    "BankAccount": preparar_banco,
+    "Vehicle.drive": preparar_vehiculo,
+    "calcular_area_circulo": preparar_circulo,
+}
+
+
+# --- Medición ---
+
+def percentil(ordenados, porcentaje):
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * porcentaje / 100))]
+
+
+def medir_caso(preparar, cantidad, medir_memoria=True):
+    reloj = time.perf_counter_ns
+    # La salida de los métodos (print) se descarta, pero su costo se incluye.
+    with open(os.devnull, "w") as nulo, contextlib.redirect_stdout(nulo):
+        # Rendimiento: un solo reloj alrededor del lazo, sin costo de medición por operación.
+        operacion = preparar(cantidad)
+        inicio_total = reloj()
+        for numero in range(cantidad):
+            operacion(numero)
+        duracion_total = reloj() - inicio_total
+
+        # Latencias: una muestra aparte, midiendo cada operación.
+        latencias = array('Q')
+        for numero in range(min(cantidad, MUESTRAS_LATENCIA)):
+            inicio = reloj()
+            operacion(numero)
+            latencias.append(reloj() - inicio)
+
+        memoria_pico = None
+        if medir_memoria:
+            # Tercera pasada con tracemalloc activo (lo hace más lento, por eso va aparte).
+            tracemalloc.start()
+            operacion = preparar(cantidad)
+            for numero in range(cantidad):
+                operacion(numero)
+            memoria_pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        # Se libera el estado dentro del bloque para que los destructores no impriman fuera de él.
+        del operacion
+
+    ordenados = sorted(latencias)
+    return {
+        "operaciones": cantidad,
+        "ops_por_segundo": cantidad / (duracion_total / 1e9),
+        "latencia_ns": {
+            "p50": percentil(ordenados, 50),
+            "p90": percentil(ordenados, 90),
+            "p99": percentil(ordenados, 99),
+            "max": ordenados[-1],
+        },
+        "memoria_pico_bytes": memoria_pico,
+    }
+
+
+def ejecutar_suite(nombres_casos, tamanos, medir_memoria=True):
+    resultados = {}
+    for nombre in nombres_casos:
+        resultados[nombre] = {}
+        for cantidad in tamanos:
+            resultado = medir_caso(CASOS[nombre], cantidad, medir_memoria)
+            resultados[nombre][str(cantidad)] = resultado
+            print(f"{nombre:<36}{cantidad:>10}{resultado['ops_por_segundo']:>16,.0f} ops/s"
+                  f"{resultado['latencia_ns']['p50']:>10} ns p50{resultado['latencia_ns']['p99']:>10} ns p99",
+                  flush=True)
+    return {
+        "fecha": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def comparar_con_base(actual, base, tolerancia=TOLERANCIA):
+    # Devuelve (caso, tamaño, ops base, ops actual) de cada caso que empeoró.
+    regresiones = []
+    for nombre, por_tamano in actual["resultados"].items():
+        for cantidad, resultado in por_tamano.items():
+            anterior = base.get("resultados", {}).get(nombre, {}).get(cantidad)
+            if anterior is None:
+                continue
+            if resultado["ops_por_segundo"] < anterior["ops_por_segundo"] * (1 - tolerancia):
+                regresiones.append((nombre, cantidad, anterior["ops_por_segundo"], resultado["ops_por_segundo"]))
+    return regresiones
+
+
+def main(argumentos=None):
+    analizador = argparse.ArgumentParser(description="Benchmarks de los métodos más usados del repositorio.")
+    analizador.add_argument("--tamanos", type=int, nargs="+", default=list(TAMANOS),
+                            help="cantidad de operaciones por caso (por defecto 10^3 a 10^6)")
+    analizador.add_argument("--casos", nargs="+", choices=sorted(CASOS), default=list(CASOS),
+                            help="casos a ejecutar (por defecto todos)")
+    analizador.add_argument("--salida", help="archivo JSON donde guardar los resultados")
+    analizador.add_argument("--base", help="archivo JSON de una ejecución anterior para comparar")
+    analizador.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                            help="caída relativa de ops/s que se considera regresión (0.20 = 20 %%)")
+    analizador.add_argument("--sin-memoria", action="store_true", help="no medir la memoria pico")
+    opciones = analizador.parse_args(argumentos)
+
+    actual = ejecutar_suite(opciones.casos, opciones.tamanos, not opciones.sin_memoria)
+    if opciones.salida:
+        with open(opciones.salida, "w", encoding="utf-8") as archivo:
+            json.dump(actual, archivo, indent=2, ensure_ascii=False)
+
+    if opciones.base:
+        with open(opciones.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar_con_base(actual, base, opciones.tolerancia)
+        for nombre, cantidad, anterior, nuevo in regresiones:
+            print(f"REGRESIÓN {nombre} ({cantidad}): {anterior:,.0f} -> {nuevo:,.0f} ops/s")
+        if regresiones:
+            return 1
+        print("Sin regresiones respecto de la base.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+# Instrumentación opcional de los métodos más usados de las clases del curso.
+#  Cuenta llamadas, tiempo acumulado y un histograma de latencias por método,
+#  y exporta una instantánea en formato de texto de Prometheus.
+#
+#  - Desactivada no cuesta nada: instrumentar_metodos() reemplaza los métodos
+#    de la clase solo mientras la instrumentación está activa y los restaura
+#    al desactivarla.
+#  - Activada, cada hilo escribe en sus propios contadores (sin locks); la
+#    instantánea suma los contadores de todos los hilos.
+#
+#  Ejemplo:
+#    import instrumentacion
+#    instrumentacion.instrumentar_metodos(Sensor, "leer_valor")
+#    instrumentacion.activar()
+#    ...
+#    instrumentacion.exportar_prometheus("metricas.prom")
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# Límites superiores de los cubos del histograma, en segundos.
+LIMITES_LATENCIA = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0)
+_LIMITES_NS = tuple(int(limite * 1e9) for limite in LIMITES_LATENCIA)
+
+# Métodos de interés por clase, para instrumentar_modulo().
+METODOS_CALIENTES = {
+    "Sensor": ("leer_valor",),
+    "Estudiante": ("_calcular_promedio_general", "registrar_calificacion"),
+    "Personaje": ("atacar",),
+    "Book": ("borrow",),
+    "Vehicle": ("drive",),
+}
+
+
+class RegistroMetricas:
+    """Guarda los contadores de cada hilo y los métodos instrumentados."""
+
+    def __init__(self):
+        self.activo = False
+        self._local = threading.local()
+        self._contadores_por_hilo = []  # Un diccionario por hilo: nombre -> [llamadas, ns, cubos...]
+        self._lock_hilos = threading.Lock()  # Solo se usa la primera vez que mide cada hilo.
+        self._parches = []  # (clase, nombre del método, función original, definido en la clase)
+
+    def _contadores(self):
+        try:
+            return self._local.contadores
+        except AttributeError:
+            contadores = self._local.contadores = {}
+            with self._lock_hilos:
+                self._contadores_por_hilo.append(contadores)
+            return contadores
+
+    def registrar(self, nombre, duracion_ns):
+        """Suma una llamada de 'duracion_ns' nanosegundos a la métrica 'nombre'."""
+        contadores = self._contadores()
+        metrica = contadores.get(nombre)
+        if metrica is None:
+            metrica = contadores[nombre] = [0, 0] + [0] * (len(_LIMITES_NS) + 1)
+        metrica[0] += 1
+        metrica[1] += duracion_ns
+        metrica[2 + bisect_left(_LIMITES_NS, duracion_ns)] += 1
+
+    def envolver(self, funcion, nombre):
+        """Devuelve 'funcion' envuelta para medir cada llamada."""
+        registrar = self.registrar
+        reloj = time.perf_counter_ns
+
+        @functools.wraps(funcion)
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                registrar(nombre, reloj() - inicio)
+        medida.__wrapped_original__ = funcion
+        return medida
+
+    def instrumentar_metodos(self, clase, *nombres):
+        """Marca métodos de 'clase' para medirlos mientras el registro esté activo."""
+        for nombre in nombres:
+            if any(c is clase and n == nombre for c, n, _, _ in self._parches):
+                continue
+            propio = nombre in vars(clase)
+            original = vars(clase)[nombre] if propio else getattr(clase, nombre)
+            self._parches.append((clase, nombre, original, propio))
+            if self.activo:
+                setattr(clase, nombre, self.envolver(original, f"{clase.__name__}.{nombre}"))
+
+    def activar(self):
+        if self.activo:
+            return
+        self.activo = True
+        for clase, nombre, original, _ in self._parches:
+            setattr(clase, nombre, self.envolver(original, f"{clase.__name__}.{nombre}"))
+
+    def desactivar(self):
+        """Restaura los métodos originales: desde aquí el costo vuelve a ser cero."""
+        if not self.activo:
+            return
+        self.activo = False
+        for clase, nombre, original, propio in reversed(self._parches):
+            if propio:
+                setattr(clase, nombre, original)
+            else:
+                delattr(clase, nombre)
+
+    def reiniciar(self):
+        """Pone en cero los contadores de todos los hilos."""
+        with self._lock_hilos:
+            for contadores in self._contadores_por_hilo:
+                contadores.clear()
+
+    def instantanea(self):
+        """Devuelve {nombre: {'llamadas', 'segundos', 'cubos'}} sumando todos los hilos."""
+        totales = {}
+        with self._lock_hilos:
+            contadores_por_hilo = list(self._contadores_por_hilo)
+        for contadores in contadores_por_hilo:
+            for nombre, metrica in list(contadores.items()):
+                total = totales.setdefault(nombre, [0] * len(metrica))
+                for posicion, valor in enumerate(metrica):
+                    total[posicion] += valor
+        return {
+            nombre: {"llamadas": total[0], "segundos": total[1] / 1e9, "cubos": total[2:]}
+            for nombre, total in sorted(totales.items())
+        }
+
+    def texto_prometheus(self, prefijo="poo"):
+        """Formatea la instantánea en el formato de texto de Prometheus."""
+        datos = self.instantanea()
+        lineas = [
+            f"# HELP {prefijo}_llamadas_total Cantidad de llamadas por método.",
+            f"# TYPE {prefijo}_llamadas_total counter",
+        ]
+        lineas += [f'{prefijo}_llamadas_total{{metodo="{n}"}} {d["llamadas"]}' for n, d in datos.items()]
+        lineas += [
+            f"# HELP {prefijo}_tiempo_segundos_total Tiempo acumulado por método.",
+            f"# TYPE {prefijo}_tiempo_segundos_total counter",
+        ]
+        lineas += [f'{prefijo}_tiempo_segundos_total{{metodo="{n}"}} {d["segundos"]:.9f}' for n, d in datos.items()]
+        lineas += [
+            f"# HELP {prefijo}_latencia_segundos Latencia de cada llamada por método.",
+            f"# TYPE {prefijo}_latencia_segundos histogram",
+        ]
+        for nombre, dato in datos.items():
+            acumulado = 0
+            for limite, cantidad in zip(LIMITES_LATENCIA + ("+Inf",), dato["cubos"]):
+                acumulado += cantidad
+                lineas.append(f'{prefijo}_latencia_segundos_bucket{{metodo="{nombre}",le="{limite}"}} {acumulado}')
+            lineas.append(f'{prefijo}_latencia_segundos_sum{{metodo="{nombre}"}} {dato["segundos"]:.9f}')
+            lineas.append(f'{prefijo}_latencia_segundos_count{{metodo="{nombre}"}} {dato["llamadas"]}')
+        return "\n".join(lineas) + "\n"
+
+    def exportar_prometheus(self, ruta_archivo, prefijo="poo"):
+        """Escribe la instantánea en 'ruta_archivo' (reemplazo atómico)."""
+        temporal = f"{ruta_archivo}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.texto_prometheus(prefijo))
+        os.replace(temporal, ruta_archivo)
+
+
+# Registro global y atajos a sus métodos.
+REGISTRO = RegistroMetricas()
+activar = REGISTRO.activar
+desactivar = REGISTRO.desactivar
+reiniciar = REGISTRO.reiniciar
+instantanea = REGISTRO.instantanea
+instrumentar_metodos = REGISTRO.instrumentar_metodos
+exportar_prometheus = REGISTRO.exportar_prometheus
+
+
+def instrumentado(nombre=None):
+    """Decorador para funciones nuevas: mide solo si el registro global está activo."""
+    def decorador(funcion):
+        nombre_metrica = nombre or funcion.__qualname__
+        medida = REGISTRO.envolver(funcion, nombre_metrica)
+
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            if REGISTRO.activo:
+                return medida(*args, **kwargs)
+            return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def instrumentar_modulo(modulo, metodos=METODOS_CALIENTES):
+    """Marca los métodos de METODOS_CALIENTES de las clases que existan en 'modulo'."""
+    for nombre_clase, nombres_metodos in metodos.items():
+        clase = getattr(modulo, nombre_clase, None)
+        if isinstance(clase, type):
+            instrumentar_metodos(clase, *nombres_metodos)
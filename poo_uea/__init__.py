@@ -0,0 +1,139 @@
+# Paquete para reutilizar las clases del curso desde otros programas.
+#  Los ejemplos viven en carpetas con espacios y puntos en el nombre, así que
+#  no se pueden importar directamente. Este paquete los carga por ruta y solo
+#  cuando se usan por primera vez (__getattr__ del módulo), por lo que
+#  'import poo_uea' no carga ningún ejemplo ni ejecuta sus demostraciones.
+#
+#  Ejemplo:
+#    import poo_uea
+#    cuenta = poo_uea.BankAccount(1000)   # carga solo el ejemplo del banco
+#    poo_uea.biblioteca.Librarian("Juan")  # submódulo completo
+#    poo_uea.demo("personajes")            # ejecuta la demostración original
+#
+#  Las demostraciones también se ejecutan con: python -m poo_uea <ejemplo>
+#
+#  Para que el arranque sea mínimo se evita importar pathlib e importlib.util
+#  (este último se importa recién al cargar el primer ejemplo).
+
+import importlib
+import os
+import sys
+
+_RAIZ_REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_UNIDAD_1 = os.path.join(_RAIZ_REPO, "UNIDAD 1")
+_UNIDAD_2 = os.path.join(_RAIZ_REPO, "UNIDAD 2", "1.1. Tipos de Datos e Identificadores")
+
+# Submódulo -> archivo del ejemplo.
+RUTAS_EJEMPLOS = {
+    "circulo": os.path.join(_RAIZ_REPO, "CalcularElAreaDelCírculo_POO", "CalcularElAreaDelCírculo.py"),
+    "universidad": os.path.join(_RAIZ_REPO, "SEMANA 6 clases_herencia_polimorfismo.py", "SEMANA_6_clases_herencia_polimorfismo.py"),
+    "sensores": os.path.join(_RAIZ_REPO, "SEMANA 7 uso de constructores y destructores", "Semana 7 Uso de constructores y destructores.py"),
+    "personajes": os.path.join(_UNIDAD_1, "1.2. Tecnicas de Programacion", "1.2.1. Ejemplo Tecnicas de Programacion.py"),
+    "banco": os.path.join(_UNIDAD_1, "2.1. Programacion tradicional frente a POO", "2.1-1. Ejemplo Programacion tradicional frente a POO.py"),
+    "vehiculo": os.path.join(_UNIDAD_1, "2.1. Programacion tradicional frente a POO", "2.1-2. Ejemplo No. 02 - POO.py"),
+    "vehiculo_tradicional": os.path.join(_UNIDAD_1, "2.1. Programacion tradicional frente a POO", "2.1-2. Ejemplo No. 02 - Programacion tradicional.py"),
+    "carro_acciones": os.path.join(_UNIDAD_1, "2.2. Caracteristicas de la POO", "2.2-1. Ejemplo - Carro y Acciones.py"),
+    "carro_persona": os.path.join(_UNIDAD_1, "2.2. Caracteristicas de la POO", "2.2-2. Ejemplo - Carro Relacion Persona.py"),
+    "carro_atributos": os.path.join(_UNIDAD_1, "2.2. Caracteristicas de la POO", "2.2-3. Ejemplo - Print Atributos Clase.py"),
+    "biblioteca": os.path.join(_UNIDAD_1, "2.2. Caracteristicas de la POO", "2.2-4. Ejemplo - Libro, Bibliotecario y Usuario.py"),
+    "biblioteca_roles": os.path.join(_UNIDAD_1, "2.2. Caracteristicas de la POO", "2.2-5. Ejemplo - Libro, Persona y Rol.py"),
+    "nomenclatura": os.path.join(_UNIDAD_2, "2.1.1-1 - Nomenclatura en Python.py"),
+    "identificadores": os.path.join(_UNIDAD_2, "2.1.1-2 - Ejemplo Identificadores correctos (Python).py"),
+    "identificadores_poco_claros": os.path.join(_UNIDAD_2, "2.1.1-3 - Ejemplo Identificadores poco claros (Python).py"),
+}
+
+# Nombre exportado -> submódulo que lo define. Cuando varios ejemplos definen
+# una clase con el mismo nombre (Carro, Book) se exporta la versión más completa
+# y las que deben usarse juntas con otras exportaciones van con otro nombre
+# (ver NOMBRES_ORIGINALES); el resto sigue disponible desde su submódulo.
+EXPORTACIONES = {
+    "calcular_area_circulo": "circulo",
+    "calcular_areas_circulos": "circulo",
+    "Materia": "universidad",
+    "Estudiante": "universidad",
+    "Profesor": "universidad",
+    "RankingEstudiantes": "universidad",
+    "Sensor": "sensores",
+    "PlanificadorSensores": "sensores",
+    "Personaje": "personajes",
+    "Guerrero": "personajes",
+    "Mago": "personajes",
+    "combate": "personajes",
+    "Arena": "personajes",
+    "BankAccount": "banco",
+    "Vehicle": "vehiculo",
+    "Fleet": "vehiculo",
+    "Carro": "carro_acciones",
+    "LineaTiempoVelocidad": "carro_acciones",
+    "CarroConConductor": "carro_persona",
+    "Persona": "carro_persona",
+    "RegistroAsignaciones": "carro_persona",
+    "Book": "biblioteca",
+    "Librarian": "biblioteca",
+    "User": "biblioteca",
+    "LoanIndex": "biblioteca",
+    "Person": "biblioteca_roles",
+    "VehiculoElectrico": "nomenclatura",
+    "calcular_distancia": "nomenclatura",
+    "PlanificadorAutonomia": "nomenclatura",
+    "crear_usuario": "identificadores",
+    "AlmacenUsuarios": "identificadores",
+}
+
+# Nombre exportado -> nombre en su ejemplo, para las exportaciones renombradas.
+# RegistroAsignaciones trabaja con el Carro y la Persona de carro_persona, no
+# con el Carro de carro_acciones que se exporta como 'Carro'.
+NOMBRES_ORIGINALES = {
+    "CarroConConductor": "Carro",
+}
+
+__all__ = sorted(EXPORTACIONES) + sorted(RUTAS_EJEMPLOS) + ["demo"]
+
+class _BuscadorEjemplos:
+    # Permite 'import poo_uea.biblioteca' aunque el archivo no esté dentro del paquete.
+
+    @staticmethod
+    def find_spec(nombre_completo, ruta=None, objetivo=None):
+        paquete, _, nombre = nombre_completo.rpartition(".")
+        if paquete == __name__ and nombre in RUTAS_EJEMPLOS:
+            import importlib.util
+
+            return importlib.util.spec_from_file_location(nombre_completo, RUTAS_EJEMPLOS[nombre])
+        return None
+
+
+if not any(isinstance(buscador, _BuscadorEjemplos) for buscador in sys.meta_path):
+    sys.meta_path.append(_BuscadorEjemplos())
+
+
+def _cargar_ejemplo(nombre):
+    # import_module registra el submódulo en sys.modules y en el paquete,
+    # así que los siguientes accesos ya no pasan por __getattr__.
+    return importlib.import_module(f"{__name__}.{nombre}")
+
+
+def __getattr__(nombre):
+    if nombre in RUTAS_EJEMPLOS:
+        return _cargar_ejemplo(nombre)
+    if nombre in EXPORTACIONES:
+        valor = getattr(_cargar_ejemplo(EXPORTACIONES[nombre]), NOMBRES_ORIGINALES.get(nombre, nombre))
+        globals()[nombre] = valor
+        return valor
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def demo(nombre, argumentos=()):
+    """Ejecuta la demostración original de un ejemplo, como si se corriera el archivo."""
+    import runpy
+
+    ruta = RUTAS_EJEMPLOS[nombre]
+    argv_anterior = sys.argv
+    sys.argv = [ruta, *argumentos]
+    try:
+        runpy.run_path(ruta, run_name="__main__")
+    finally:
+        sys.argv = argv_anterior
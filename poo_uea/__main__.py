@@ -0,0 +1,21 @@
+# Ejecuta la demostración de un ejemplo del curso: python -m poo_uea <ejemplo> [argumentos]
+#  Sin argumentos, lista los ejemplos disponibles.
+
+import os
+import sys
+
+from poo_uea import RUTAS_EJEMPLOS, demo
+
+
+def main(argumentos):
+    if not argumentos or argumentos[0] not in RUTAS_EJEMPLOS:
+        print("uso: python -m poo_uea <ejemplo> [argumentos]\n\nEjemplos disponibles:")
+        for nombre, ruta in RUTAS_EJEMPLOS.items():
+            print(f"  {nombre:<28}{os.path.basename(ruta)}")
+        return 0 if not argumentos else 2
+    demo(argumentos[0], argumentos[1:])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,60 @@
+# Regresión: el planificador de sensores con un reloj simulado (sin esperas reales).
+#  Uso: python -m pytest tests
+
+import contextlib
+import io
+import pathlib
+import sys
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402
+
+
+class RelojSimulado:
+    # Reloj que solo avanza cuando el planificador "duerme".
+    def __init__(self):
+        self.ahora = 0.0
+
+    def reloj(self):
+        return self.ahora
+
+    def dormir(self, segundos):
+        self.ahora += segundos
+
+
+def crear_planificador(reloj):
+    return poo_uea.sensores.PlanificadorSensores(reloj=reloj.reloj, dormir=reloj.dormir)
+
+
+def crear_sensor(id_sensor):
+    sensor = poo_uea.sensores.Sensor(id_sensor, "Temperatura", "°C", 20.0)
+    sensor.RETARDO_LECTURA = 0
+    return sensor
+
+
+def test_sensor_desactivado_sale_del_planificador():
+    reloj = RelojSimulado()
+    with contextlib.redirect_stdout(io.StringIO()):
+        planificador = crear_planificador(reloj)
+        sensor = crear_sensor("T_100")
+        planificador.agregar(sensor, 1.0)
+        planificador.ejecutar(2.5)
+        assert planificador.lecturas_realizadas == 3  # t = 0, 1 y 2.
+
+        sensor.desactivar()
+        planificador.ejecutar(2.0)  # Antes fallaba con TypeError al comparar con None.
+        assert planificador.lecturas_realizadas == 3
+        assert len(planificador) == 0
+
+
+def test_agregar_dos_veces_no_duplica_lecturas():
+    reloj = RelojSimulado()
+    with contextlib.redirect_stdout(io.StringIO()):
+        planificador = crear_planificador(reloj)
+        sensor = crear_sensor("T_101")
+        planificador.agregar(sensor, 1.0)
+        planificador.agregar(sensor, 1.0)
+        planificador.ejecutar(4.5)
+        assert planificador.lecturas_realizadas == 5  # t = 0, 1, 2, 3 y 4.
+        assert planificador.reporte_retraso()["retraso_maximo"] == 0.0
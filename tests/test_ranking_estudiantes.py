@@ -0,0 +1,89 @@
+# Pruebas de RankingEstudiantes: un estudiante en varios rankings y una
+#  comparación aleatoria contra sorted() con bloques chicos.
+#  Uso: python -m pytest tests
+
+import contextlib
+import io
+import itertools
+import pathlib
+import random
+import sys
+
+RAIZ_REPO = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ_REPO))
+import poo_uea  # noqa: E402
+
+
+def crear_estudiante(universidad, materia, nombre, notas):
+    estudiante = universidad.Estudiante(nombre, nombre.lower(), nombre, "TICS")
+    estudiante.matricular_materia(materia)
+    for nota in notas:
+        estudiante.registrar_calificacion("POO101", nota)
+    return estudiante
+
+
+def orden(ranking):
+    return [ranking.estudiante_en(i) for i in range(len(ranking))]
+
+
+def test_estudiante_en_varios_rankings():
+    universidad = poo_uea.universidad
+    with contextlib.redirect_stdout(io.StringIO()):
+        materia = universidad.Materia("Programación Orientada a Objetos", "POO101", 4)
+        a = crear_estudiante(universidad, materia, "A", [50])
+        b = crear_estudiante(universidad, materia, "B", [60])
+        r1 = universidad.RankingEstudiantes()
+        r2 = universidad.RankingEstudiantes()
+        r1.agregar_varios([a, b])
+        r2.agregar(a)
+        r2.agregar(b)
+
+        a.registrar_calificacion("POO101", 100)  # A sube a 75: debe pasar primero en ambos.
+        assert orden(r1) == [a, b]
+        assert orden(r2) == [a, b]
+
+        r1.quitar(a)
+        a.registrar_calificacion("POO101", 0)  # A baja a 50: r2 debe seguir enterado.
+        assert orden(r1) == [b]
+        assert orden(r2) == [b, a]
+        assert r2.posicion(a) == 1
+
+
+def test_ranking_coincide_con_sorted():
+    # CARGA chica para que los bloques se dividan y se vacíen a menudo.
+    universidad = poo_uea.universidad
+
+    class RankingChico(universidad.RankingEstudiantes):
+        CARGA = 2
+
+    generador = random.Random(2025)
+    with contextlib.redirect_stdout(io.StringIO()):
+        materia = universidad.Materia("Programación Orientada a Objetos", "POO101", 4)
+        estudiantes = [crear_estudiante(universidad, materia, f"E{numero}", [generador.randint(0, 100)])
+                       for numero in range(40)]
+        ranking = RankingChico()
+        orden_ingreso = {}
+        ingresos = itertools.count()
+        ranking.agregar_varios(estudiantes[:20])
+        for estudiante in estudiantes[:20]:
+            orden_ingreso[estudiante] = next(ingresos)
+
+        for _ in range(2000):
+            estudiante = generador.choice(estudiantes)
+            accion = generador.random()
+            if estudiante not in orden_ingreso:
+                ranking.agregar(estudiante)
+                orden_ingreso[estudiante] = next(ingresos)
+            elif accion < 0.2:
+                ranking.quitar(estudiante)
+                del orden_ingreso[estudiante]
+            else:
+                estudiante.registrar_calificacion("POO101", generador.randint(0, 100))
+
+            esperado = sorted(orden_ingreso, key=lambda e: (-e.obtener_promedio_general(), orden_ingreso[e]))
+            assert len(ranking) == len(esperado)
+            assert orden(ranking) == esperado
+            for posicion, miembro in enumerate(esperado):
+                assert ranking.posicion(miembro) == posicion
+            k = generador.randint(-3, len(esperado) + 3)
+            assert ranking.mejores(k) == esperado[:max(k, 0)]